@@ -11,6 +11,11 @@ from typing import Any
 
 from .models import ApiError, JobStatus, ProgressInfo
 
+try:  # optional C encoder for the (large) result document
+    import orjson
+except ImportError:  # pragma: no cover - depends on the deployment
+    orjson = None
+
 
 @dataclass(frozen=True)
 class JobPaths:
@@ -23,15 +28,30 @@ class JobPaths:
     artifacts_dir: Path
 
 
+_TERMINAL_STATUSES = (JobStatus.succeeded, JobStatus.failed)
+_TERMINAL_STATUS_VALUES = tuple(s.value for s in _TERMINAL_STATUSES)
+
+
 def _now_ms() -> int:
     return int(time.time() * 1000)
 
 
+def _dumps_result(payload: dict[str, Any]) -> bytes:
+    """Encode a job result in the same indented, key-sorted layout as the
+    other job files. The result holds one row per tracked/reconstructed
+    point, so it is by far the largest document; orjson encodes it in C."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+    return json.dumps(payload, indent=2, sort_keys=True).encode("utf-8")
+
+
 class JobStore:
     def __init__(self, data_dir: Path):
         self._data_dir = data_dir
         self._data_dir.mkdir(parents=True, exist_ok=True)
         self._lock = threading.Lock()
+        # Notified (under ``_lock``) whenever a job reaches a terminal status.
+        self._finished = threading.Condition(self._lock)
 
     @property
     def data_dir(self) -> Path:
@@ -85,6 +105,11 @@ class JobStore:
         tmp.write_text(text)
         os.replace(tmp, path)
 
+    def _atomic_write_bytes(self, path: Path, data: bytes) -> None:
+        tmp = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
     def _atomic_write_json(self, path: Path, payload: dict[str, Any]) -> None:
         self._atomic_write_text(path, json.dumps(payload, indent=2, sort_keys=True))
 
@@ -131,6 +156,33 @@ class JobStore:
         }
         with self._lock:
             self._atomic_write_json(paths.status_path, payload)
+            if status in _TERMINAL_STATUSES:
+                self._finished.notify_all()
+
+    def wait(self, job_id: str, timeout: float | None = None) -> bool:
+        """Block until the job is ``succeeded``/``failed``; False on timeout.
+
+        Wakes as soon as the worker writes the terminal status, instead of the
+        caller re-reading status.json on a timer. Each wake-up re-checks the
+        job's own status, so any number of callers can wait on one job.
+        """
+        paths = self.job_paths(job_id)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._finished:
+            while not self._is_finished(paths):
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._finished.wait(remaining)
+            return True
+
+    def _is_finished(self, paths: JobPaths) -> bool:
+        # Caller holds ``_lock``.
+        try:
+            raw = paths.status_path.read_text()
+        except FileNotFoundError:
+            return False
+        return bool(raw.strip()) and json.loads(raw).get("status") in _TERMINAL_STATUS_VALUES
 
     def read_status(self, paths: JobPaths) -> dict[str, Any]:
         # Polling can hit while a background thread updates status; keep reads consistent.
@@ -143,15 +195,19 @@ class JobStore:
         return json.loads(raw)
 
     def write_result(self, paths: JobPaths, payload: dict[str, Any]) -> None:
+        # Encode outside the lock; only the file swap needs to be serialised.
+        data = _dumps_result(payload)
         with self._lock:
-            self._atomic_write_json(paths.result_path, payload)
+            self._atomic_write_bytes(paths.result_path, data)
 
     def read_result(self, paths: JobPaths) -> dict[str, Any]:
         with self._lock:
-            raw = paths.result_path.read_text()
+            raw = paths.result_path.read_bytes()
         if not raw.strip():
             raise RuntimeError("Job result unavailable (empty result file)")
-        return json.loads(raw)
+        # Bytes, not text: orjson writes UTF-8 (warnings carry em dashes), so
+        # decoding with the locale's default encoding would be wrong.
+        return orjson.loads(raw) if orjson is not None else json.loads(raw)
 
     def recover_interrupted_jobs(self) -> list[str]:
         """Mark jobs left ``queued``/``running`` by a previous process as ``failed``.
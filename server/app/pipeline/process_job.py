@@ -41,13 +41,16 @@ Output schema (consumed by the Flutter client):
 
 from __future__ import annotations
 
+import itertools
 import json
 import logging
 import math
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
+from enum import IntEnum
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Iterable, Iterator
 
 import cv2
 import numpy as np
@@ -57,18 +60,26 @@ from .calibration import CalibrationError
 from .reconstruction import (
     BALL_RADIUS_M,
     DEFAULT_STUMP_HEIGHT_M,
-    GRAVITY_MS2,
-    Reconstruction,
-    backproject_to_ground,
     build_overlay_px,
     predict_path_to_stumps,
     reconstruct_trajectory,
     solve_camera_pose_from_stumps,
 )
-from .tracking import CombinedBallDetector, YoloBallDetector, build_pitch_roi_mask
+from .tracking import (
+    CombinedBallDetector,
+    SharedHsvFrame,
+    SharedMotionDetector,
+    YoloBallDetector,
+    build_pitch_roi_mask,
+)
 from .trajectory import find_ball_trajectory
 from .video import VideoDecodeError, VideoReader
 
+try:  # optional C encoder; the stdlib fallback produces the same JSON
+    import orjson
+except ImportError:  # pragma: no cover - depends on the deployment
+    orjson = None
+
 
 _log = logging.getLogger("pocket_drs.pipeline")
 
@@ -77,6 +88,16 @@ WICKET_HALF_WIDTH_M = 0.2286 / 2.0      # one stump line is ±wicket_half_width
 WICKET_GUARD_M = WICKET_HALF_WIDTH_M + BALL_RADIUS_M
 UMPIRES_CALL_BAND_M = 0.050             # ±50 mm on the edge → umpire's call
 
+
+class Decision(IntEnum):
+    OUT = 0
+    NOT_OUT = 1
+    UMPIRES_CALL = 2
+
+
+# Wire form of each Decision (the client's ``lbw.decision`` contract).
+_DECISION_STR = ("out", "not_out", "umpires_call")
+
 # Calibration is rejected above this reprojection error. The fractional bound
 # (~3% of frame width, ≈32 px on 1080p) keeps it resolution-independent; the
 # absolute floor guards very small frames. A correct full-pitch tap calibration
@@ -105,6 +126,10 @@ FIT_RMS_SPAN_FRAC = 0.14
 
 ProgressFn = Callable[[int, str], None]
 
+# Artifact files (frame0 preview, debug dump) are not part of the response, so
+# they are written off the job thread instead of blocking it on disk I/O.
+_IO_POOL = ThreadPoolExecutor(max_workers=2, thread_name_prefix="artifact-io")
+
 
 def _default_yolo_weights() -> str | None:
     """Bundled cricket-ball YOLO weights, if present (server/models/…)."""
@@ -112,6 +137,35 @@ def _default_yolo_weights() -> str | None:
     return str(p) if p.exists() else None
 
 
+def _write_artifact_async(path: Path, render: Callable[[], bytes | None]) -> Future:
+    """Encode (``render``) and write an artifact file off the job thread.
+
+    Failures are only logged; ``render`` returning None skips the write. The
+    returned future lets a caller wait for a file the client will fetch.
+    """
+    def _write() -> None:
+        try:
+            data = render()
+            if data is not None:
+                path.write_bytes(data)
+        except Exception:  # noqa: BLE001 — artifacts are best-effort
+            _log.warning("artifact write failed: %s", path, exc_info=True)
+
+    return _IO_POOL.submit(_write)
+
+
+def _encode_jpeg(frame: np.ndarray) -> bytes | None:
+    ok, jpg = cv2.imencode(".jpg", frame)
+    return jpg.tobytes() if ok else None
+
+
+def _dumps_json(obj) -> bytes:
+    """Indented JSON for the debug dump; orjson when installed, else stdlib."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=str, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2, default=str).encode("utf-8")
+
+
 def _finite_or_none(result):
     """Return a copy of the result with every non-finite float (NaN/Inf)
     replaced by None and numpy scalars/arrays coerced to plain Python, while
@@ -156,6 +210,134 @@ def _rotate_frame(frame: np.ndarray, rotation_deg: int) -> np.ndarray:
     return frame
 
 
+def _default_decode_threads() -> int | None:
+    """FFmpeg decoder threads from ``POCKET_DRS_DECODE_THREADS``, or None to
+    leave FFmpeg's own default (already one per CPU) untouched. Sample times
+    are fetched by frame index, so frame-level decoder threading cannot
+    reorder what the pipeline sees."""
+    raw = os.environ.get("POCKET_DRS_DECODE_THREADS")
+    if raw:
+        try:
+            return max(1, int(raw))
+        except ValueError:
+            _log.warning("ignoring non-integer POCKET_DRS_DECODE_THREADS=%r", raw)
+    return None
+
+
+# Frames decoded ahead of the detectors. Decode and detection both run in
+# OpenCV with the GIL released, so a small lookahead overlaps them on a
+# multi-core host while bounding memory (8 x 1080p BGR is ~50 MB). On a
+# single CPU there is nothing to overlap and the hand-off is pure overhead.
+DECODE_PREFETCH_FRAMES = 8
+
+
+def _iter_segment_frames(
+    reader: VideoReader,
+    times_ms: list[int],
+    rotation_deg: int,
+    warnings: list[str],
+) -> Iterator[tuple[int, np.ndarray]]:
+    """Yield the segment's upright ``(t_ms, frame)`` samples one at a time."""
+    n = 0
+    try:
+        prefetch = DECODE_PREFETCH_FRAMES if (os.cpu_count() or 1) > 1 else 0
+        for t_ms, frame in reader.iter_sampled(times_ms, prefetch=prefetch):
+            yield t_ms, _rotate_frame(frame, rotation_deg)
+            n += 1
+    except VideoDecodeError as e:
+        # Sustained decode failure means the file is truncated past this
+        # point (metadata over-reports the frame count). Analyse the frames
+        # we actually have rather than padding with stale duplicates or
+        # aborting outright.
+        if not n:
+            raise
+        warnings.append(
+            f"Video truncated: analysing {n} of "
+            f"{len(times_ms)} requested frames ({e})"
+        )
+
+
+# Below this many frames a detection pass is too short for concurrent
+# detectors to repay the thread hand-offs (as is a single-CPU host).
+PARALLEL_DETECT_MIN_FRAMES = 16
+
+
+def _detect_stream(
+    frames: Iterable[tuple[int, np.ndarray]],
+    detectors: list[tuple[object, np.ndarray | None]],
+    *,
+    n_frames: int,
+    progress: ProgressFn | None,
+) -> list[list[tuple[int, list[dict]]] | Exception]:
+    """Run every ``(detector, mask)`` over a single pass of ``frames``.
+
+    Returns one per-frame detection list per detector, in order. A detector
+    that raises is dropped from the rest of the pass and its exception is
+    returned in its slot, so one broken detector cannot sink the others.
+
+    Detectors keep state across frames (the motion detector's background
+    model), so each must see the frames one at a time and in order; the
+    frames themselves cannot be farmed out. Distinct detectors are
+    independent, though, and OpenCV/torch release the GIL, so with several
+    of them each frame is handed to all detectors concurrently.
+    """
+    out: list[list[tuple[int, list[dict]]] | Exception] = [[] for _ in detectors]
+    step = max(1, n_frames // 10)
+    next_progress_i = step
+    total = max(1, n_frames - 1)
+    pool = (
+        ThreadPoolExecutor(max_workers=len(detectors), thread_name_prefix="detect")
+        if len(detectors) > 1
+        and n_frames > PARALLEL_DETECT_MIN_FRAMES
+        and (os.cpu_count() or 1) > 1
+        else None
+    )
+    try:
+        for i, (t_ms, frame) in enumerate(frames):
+            active = [k for k in range(len(detectors)) if not isinstance(out[k], Exception)]
+            if pool is None:
+                calls = [(k, None) for k in active]
+            else:
+                calls = [
+                    (k, pool.submit(detectors[k][0].detect, frame, detectors[k][1]))
+                    for k in active
+                ]
+            for k, fut in calls:
+                try:
+                    dets = fut.result() if fut is not None else detectors[k][0].detect(frame, detectors[k][1])
+                except Exception as e:  # noqa: BLE001 — reported by the caller
+                    out[k] = e
+                    continue
+                # Cap candidates per frame so RANSAC seed pairs stay bounded.
+                out[k].append((t_ms, dets[:8]))
+            if i == next_progress_i:
+                next_progress_i += step
+                _progress(progress, 40 + int(15 * (i / total)), "tracking")
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True)
+    return out
+
+
+# One row per tracked point, in ``track.image_points`` order and naming.
+_TRACK_DTYPE = np.dtype([
+    ("t_ms", np.int64),
+    ("u", np.float64),
+    ("v", np.float64),
+    ("radius_px", np.float64),
+    ("confidence", np.float64),
+])
+
+
+def _track_array(points) -> np.ndarray:
+    """The track's points as one structured array (see ``_TRACK_DTYPE``)."""
+    return np.fromiter(
+        ((p.t_ms, p.x_px, p.y_px, p.radius_px, p.confidence) for p in points),
+        dtype=_TRACK_DTYPE,
+        count=len(points),
+    )
+
+
 @dataclass(frozen=True)
 class PipelineOutput:
     result: dict
@@ -163,13 +345,10 @@ class PipelineOutput:
 
 
 def _decode_pitch_corners(req: dict, frame_width: int, frame_height: int) -> list[tuple[float, float]] | None:
-    pts_px = req.get("pitch_corners_px")
-    pts_norm = req.get("pitch_corners_norm")
-    if pts_px and len(pts_px) == 4:
-        return [(float(p["x"]), float(p["y"])) for p in pts_px]
-    if pts_norm and len(pts_norm) == 4:
-        return [(float(p["x"]) * frame_width, float(p["y"]) * frame_height) for p in pts_norm]
-    return None
+    return _decode_point_list(
+        req, "pitch_corners_px", "pitch_corners_norm",
+        frame_width, frame_height, allowed_counts=(4,),
+    )
 
 
 def _decode_point_list(
@@ -186,6 +365,14 @@ def _decode_point_list(
     return None
 
 
+def _has_point_list(req: dict, key_px: str, key_norm: str, allowed_counts: tuple[int, ...]) -> bool:
+    """Whether ``_decode_point_list`` will find a usable list (no frame size needed)."""
+    return any(
+        bool(pts) and len(pts) in allowed_counts
+        for pts in (req.get(key_px), req.get(key_norm))
+    )
+
+
 def _decode_stump_quads(req: dict, frame_width: int, frame_height: int) -> list[tuple[float, float]] | None:
     """Decode the 8-point stump-rectangle schema.
 
@@ -287,8 +474,12 @@ def _decide_lbw(
     MARGIN_Y_UMP = BALL_RADIUS_M           # 3.6 cm
     MARGIN_Z_UMP = 2.0 * BALL_RADIUS_M     # 7.2 cm
 
-    decision = "not_out"
+    decision = Decision.NOT_OUT
     margin_text = ""
+    # Which marginal band, if any, the prediction fell in: clipping the
+    # stumps (inside) or just missing them (outside).
+    clipping = False
+    just_missing = False
     if pred_y_at_stumps is not None and pred_z_at_stumps is not None:
         hits_horizontal = abs(pred_y_at_stumps) <= WICKET_GUARD_M
         hits_vertical = 0.0 <= pred_z_at_stumps <= DEFAULT_STUMP_HEIGHT_M + BALL_RADIUS_M
@@ -304,6 +495,7 @@ def _decide_lbw(
             in_z_band = margin_z_top <= MARGIN_Z_UMP
             margin = min(margin_y, margin_z_top)
             if in_y_band or in_z_band:
+                clipping = True
                 margin_text = f" (margin {margin*100:.1f}cm umpires_band)"
             else:
                 margin_text = f" (margin {margin*100:.1f}cm)"
@@ -321,17 +513,18 @@ def _decide_lbw(
                     candidates.append(-pred_z_at_stumps)
             min_outside = min(candidates) if candidates else 0.0
             if 0.0 < min_outside <= UMPIRES_CALL_BAND_M:
+                just_missing = True
                 margin_text = f" (just missing — {min_outside*100:.1f}cm)"
 
     if all(checks.values()):
-        if margin_text and "umpires_band" in margin_text:
-            decision = "umpires_call"
+        if clipping:
+            decision = Decision.UMPIRES_CALL
             reason_parts.append(f"Umpire's call — clipping{margin_text}")
         elif margin_text:
-            decision = "out"
+            decision = Decision.OUT
             reason_parts.append(f"Hitting stumps{margin_text}")
         else:
-            decision = "out"
+            decision = Decision.OUT
             reason_parts.append("Hitting stumps")
     else:
         if not reason_parts:
@@ -341,14 +534,13 @@ def _decide_lbw(
         # outside off is a definitive not-out no matter where the predicted
         # path runs, so we must not upgrade those to umpire's call (and must
         # keep their real reason, not overwrite it).
-        if (checks["pitching_in_line"] and checks["impact_in_line"]
-                and margin_text and "just missing" in margin_text):
-            decision = "umpires_call"
+        if checks["pitching_in_line"] and checks["impact_in_line"] and just_missing:
+            decision = Decision.UMPIRES_CALL
             reason_parts[-1] = "Umpire's call" + margin_text
 
     confidence = float(max(0.20, min(0.95, 1.0 - fit_rms_m * 1.5)))
     return {
-        "decision": decision,
+        "decision": _DECISION_STR[decision],
         "reason": " · ".join(reason_parts),
         "checks": checks,
         "prediction": {
@@ -447,7 +639,7 @@ def _extend_track_to_direction_change(
     return out
 
 
-def _find_image_v_peak(points, *, min_post_frames: int = 2) -> int | None:
+def _find_image_v_peak(vs: np.ndarray, *, min_post_frames: int = 2) -> int | None:
     """Index of the image-v peak that signals a real ground contact.
 
     A genuine bounce on the pitch is the only event that flips the ball's
@@ -455,28 +647,22 @@ def _find_image_v_peak(points, *, min_post_frames: int = 2) -> int | None:
     its sign. We pick the last frame whose v is strictly greater than both
     its neighbours and whose post-peak descent is sustained for at least
     ``min_post_frames`` more frames so an end-of-clip detection drop-out
-    does not masquerade as a bounce.
+    does not masquerade as a bounce. ``vs`` is the track's image-v column.
     """
-    n = len(points)
+    n = len(vs)
     if n < 4 + min_post_frames:
         return None
-    vs = [float(p.y_px) for p in points]
-    peak_idx: int | None = None
-    for i in range(1, n - 1):
-        if not (vs[i] - vs[i - 1] > 1.0 and vs[i] - vs[i + 1] > 1.0):
-            continue
-        # Require sustained post-peak rise to reject noise.
-        post_ok = True
-        for k in range(1, min_post_frames + 1):
-            if i + k >= n or vs[i + k] >= vs[i]:
-                post_ok = False
-                break
-        if post_ok:
-            peak_idx = i
-    return peak_idx
+    idx = np.arange(1, n - 1)
+    mid = vs[1:-1]
+    ok = (mid - vs[:-2] > 1.0) & (mid - vs[2:] > 1.0)
+    # Require sustained post-peak rise to reject noise.
+    for k in range(1, min_post_frames + 1):
+        ok &= (idx + k < n) & (vs[np.minimum(idx + k, n - 1)] < mid)
+    hits = np.flatnonzero(ok)
+    return int(idx[hits[-1]]) if hits.size else None
 
 
-def _detect_impact_frame(points) -> int | None:
+def _detect_impact_frame(t: np.ndarray, u: np.ndarray) -> int | None:
     """Index of the bat/pad impact — where the ball hits something and changes
     direction — or None if it travels cleanly through to the stumps.
 
@@ -488,32 +674,31 @@ def _detect_impact_frame(points) -> int | None:
     returned index is the last point still part of the live delivery; callers
     track up to it and predict beyond it. Returns None for a near-axial view
     where horizontal motion is too small to judge (falls back to stump-plane).
+    ``t`` and ``u`` are the track's time (ms) and image-u columns.
     """
-    n = len(points)
+    n = len(t)
     if n < 8:
         return None
-    t = np.array([p.t_ms for p in points], dtype=float)
-    u = np.array([p.x_px for p in points], dtype=float)
     dt = np.diff(t)
     dt[dt == 0] = 1.0
     du = np.diff(u) / dt  # horizontal image velocity (px/ms)
-    med = float(np.median(np.abs(du)))
+    adu = np.abs(du)
+    med = float(np.median(adu))
     if med < 0.02:
         return None
     sgn = np.sign(np.median(du))
     if sgn == 0:
         return None
     start = max(2, int(0.4 * n))
-    for i in range(start, len(du) - 1):
-        # A sustained reversal of horizontal travel — the ball never turns
-        # round in the air unless it hit bat or pad. (A bounce flips only the
-        # vertical motion, so it never trips this.) Natural perspective slow-down
-        # only shrinks |du|, it does not flip the sign, so clean deliveries that
-        # carry through to the stumps are left untouched.
-        if (np.sign(du[i]) == -sgn and abs(du[i]) > 0.5 * med
-                and np.sign(du[i + 1]) == -sgn):
-            return i
-    return None
+    # A sustained reversal of horizontal travel — the ball never turns
+    # round in the air unless it hit bat or pad. (A bounce flips only the
+    # vertical motion, so it never trips this.) Natural perspective slow-down
+    # only shrinks |du|, it does not flip the sign, so clean deliveries that
+    # carry through to the stumps are left untouched.
+    s = np.sign(du)
+    rev = (s[:-1] == -sgn) & (adu[:-1] > 0.5 * med) & (s[1:] == -sgn)
+    hits = np.flatnonzero(rev[start:])
+    return int(start + hits[0]) if hits.size else None
 
 
 def _compute_metrics(
@@ -594,6 +779,7 @@ def run_pipeline(
     request_json: dict,
     artifacts_dir: Path,
     progress: ProgressFn | None = None,
+    decode_threads: int | None = None,
 ) -> PipelineOutput:
     warnings: list[str] = []
     artifacts_dir.mkdir(parents=True, exist_ok=True)
@@ -649,10 +835,21 @@ def run_pipeline(
             raise ValueError("calibration.pitch_dimensions_m.length must be numeric")
     if pitch_width_m <= 0.0 or pitch_length_m < 0.0:
         raise ValueError("calibration.pitch_dimensions_m must be positive")
+    # The tap sets only need the frame size to be scaled, not to be present:
+    # reject a request that lacks them before paying to open the video.
+    if not _has_point_list(cal_req, "pitch_corners_px", "pitch_corners_norm", (4,)):
+        raise ValueError("calibration.pitch_corners_px or .pitch_corners_norm required")
+    if not _has_point_list(cal_req, "stump_quads_px", "stump_quads_norm", (8,)):
+        raise ValueError(
+            "calibration.stump_quads_px or .stump_quads_norm "
+            "(8 points: striker TL/TR/BR/BL then bowler TL/TR/BR/BL) is required"
+        )
 
     # ----------------------------- decode -----------------------------
     _progress(progress, 5, "decode")
-    with VideoReader(str(video_path)) as reader:
+    if decode_threads is None:
+        decode_threads = _default_decode_threads()
+    with VideoReader(str(video_path), thread_count=decode_threads) as reader:
         meta = reader.meta
         if meta.duration_ms and start_ms >= meta.duration_ms:
             raise ValueError("Segment starts after video end")
@@ -673,148 +870,167 @@ def run_pipeline(
             times_ms.append(int(t))
             t += dt_ms
 
-        frames: list[np.ndarray] = []
-        for i, t_ms in enumerate(times_ms):
-            try:
-                f = reader.frame_at_ms(t_ms)
-            except VideoDecodeError as e:
-                # Sustained decode failure means the file is truncated past
-                # this point (metadata over-reports the frame count). Analyse
-                # the frames we actually have rather than padding with stale
-                # duplicates or aborting outright.
-                if frames:
-                    warnings.append(
-                        f"Video truncated: analysing {len(frames)} of "
-                        f"{len(times_ms)} requested frames ({e})"
-                    )
-                    break
-                raise
-            f = _rotate_frame(f, rotation_deg)
-            frames.append(f)
-            if i and (i % max(1, len(times_ms) // 10) == 0):
-                _progress(progress, 5 + int(20 * (i / max(1, len(times_ms) - 1))), "decode")
-
-        height, width = frames[0].shape[:2]
-        try:
-            cv2.imwrite(str(artifacts_dir / "frame0.jpg"), frames[0])
-        except Exception:
-            pass
-
-    # ----------------------------- calibrate (PnP) -----------------------------
-    _progress(progress, 30, "calibration")
+        # Frames are streamed, not collected: each one is decoded, handed to
+        # every detector and dropped, so peak memory is the decode lookahead
+        # (DECODE_PREFETCH_FRAMES, none on a single CPU) plus the reader's
+        # current frame rather than the whole segment (180 frames of 1080p
+        # BGR is ~1 GB). Only frame0 is retained — it is the calibration/ROI
+        # reference and the image the client taps on.
+        frames = _iter_segment_frames(reader, times_ms, rotation_deg, warnings)
+        frame0_t_ms, frame0 = next(frames)
+        height, width = frame0.shape[:2]
+        # The JPEG encode overlaps calibration and detection; the copy keeps
+        # it independent of whatever the pipeline does with frame0 meanwhile.
+        frame0_copy = frame0.copy()
+        frame0_write = _write_artifact_async(
+            artifacts_dir / "frame0.jpg", lambda: _encode_jpeg(frame0_copy)
+        )
 
-    pitch_corners_px = _decode_pitch_corners(cal_req, width, height)
-    if pitch_corners_px is None:
-        raise ValueError("calibration.pitch_corners_px or .pitch_corners_norm required")
-    stump_quads_px = _decode_stump_quads(cal_req, width, height)
-    if stump_quads_px is None:
-        raise ValueError(
-            "calibration.stump_quads_px or .stump_quads_norm "
-            "(8 points: striker TL/TR/BR/BL then bowler TL/TR/BR/BL) is required"
+        # ----------------------------- calibrate (PnP) -----------------------------
+        _progress(progress, 30, "calibration")
+
+        # Presence was validated up front; this only scales to the frame.
+        pitch_corners_px = _decode_pitch_corners(cal_req, width, height)
+        stump_quads_px = _decode_stump_quads(cal_req, width, height)
+
+        # Which world-Y direction is the batsman's leg side (for the LBW off/leg
+        # rules) — determined from handedness and the camera's end of the pitch.
+        leg_side_sign = _leg_side_sign(stump_quads_px, batsman_handedness)
+
+        # Camera horizontal FOV — optional override. When the caller does not
+        # supply one (the usual case from the app), the calibration solver
+        # auto-fits FOV jointly with pitch length from the stump marks, so a
+        # zoomed phone shot does not get rejected for "high reprojection".
+        _fov_raw = cal_req.get("h_fov_deg")
+        h_fov_deg = float(_fov_raw) if _fov_raw not in (None, "", 0) else None
+
+        # Stump-anchored calibration. The 8 tapped stump rectangle corners +
+        # 4 pitch turf corners feed a joint PnP that jointly auto-fits the
+        # camera FOV and the pitch length when the caller doesn't pin them.
+        pose, pitch_length_m = solve_camera_pose_from_stumps(
+            image_size=(width, height),
+            stump_quads_px=stump_quads_px,
+            pitch_corners_px=(
+                pitch_corners_px if pitch_corners_px and len(pitch_corners_px) == 4
+                else None
+            ),
+            pitch_width_m=pitch_width_m,
+            h_fov_deg=h_fov_deg,
+            known_length_m=pitch_length_m if pitch_length_m > 0.0 else None,
         )
 
-    # Which world-Y direction is the batsman's leg side (for the LBW off/leg
-    # rules) — determined from handedness and the camera's end of the pitch.
-    leg_side_sign = _leg_side_sign(stump_quads_px, batsman_handedness)
-
-    # Camera horizontal FOV — optional override. When the caller does not
-    # supply one (the usual case from the app), the calibration solver
-    # auto-fits FOV jointly with pitch length from the stump marks, so a
-    # zoomed phone shot does not get rejected for "high reprojection".
-    _fov_raw = cal_req.get("h_fov_deg")
-    h_fov_deg = float(_fov_raw) if _fov_raw not in (None, "", 0) else None
-
-    # Stump-anchored calibration. The 8 tapped stump rectangle corners +
-    # 4 pitch turf corners feed a joint PnP that jointly auto-fits the
-    # camera FOV and the pitch length when the caller doesn't pin them.
-    pose, pitch_length_m = solve_camera_pose_from_stumps(
-        image_size=(width, height),
-        stump_quads_px=stump_quads_px,
-        pitch_corners_px=(
-            pitch_corners_px if pitch_corners_px and len(pitch_corners_px) == 4
-            else None
-        ),
-        pitch_width_m=pitch_width_m,
-        h_fov_deg=h_fov_deg,
-        known_length_m=pitch_length_m if pitch_length_m > 0.0 else None,
-    )
+        # Hard reject a calibration whose marks cannot form a consistent
+        # perspective view. The marks always admit an exact 2D homography but
+        # only a geometrically valid set yields a low PnP reprojection error;
+        # a large error means the recovered pose is meaningless. Proceeding
+        # would emit a confident-but-wrong 3D reconstruction, so we stop here.
+        # The bound scales with frame width to stay resolution-independent.
+        reject_px = max(CALIB_REJECT_REPROJ_PX, CALIB_REJECT_REPROJ_FRAC * width)
+        if pose.reproj_error_px > reject_px:
+            raise CalibrationError(
+                f"Calibration rejected: reprojection error {pose.reproj_error_px:.0f} px "
+                f"exceeds {reject_px:.0f} px. The stump marks are not consistent — "
+                "re-tap the four corners of each stump cluster more precisely."
+            )
+        if pose.reproj_error_px > 8.0:
+            warnings.append(
+                f"High reprojection error ({pose.reproj_error_px:.1f} px) — "
+                "calibration accuracy may be poor; re-tap the stump corners precisely."
+            )
 
-    # Hard reject a calibration whose marks cannot form a consistent
-    # perspective view. The marks always admit an exact 2D homography but
-    # only a geometrically valid set yields a low PnP reprojection error;
-    # a large error means the recovered pose is meaningless. Proceeding
-    # would emit a confident-but-wrong 3D reconstruction, so we stop here.
-    # The bound scales with frame width to stay resolution-independent.
-    reject_px = max(CALIB_REJECT_REPROJ_PX, CALIB_REJECT_REPROJ_FRAC * width)
-    if pose.reproj_error_px > reject_px:
-        raise CalibrationError(
-            f"Calibration rejected: reprojection error {pose.reproj_error_px:.0f} px "
-            f"exceeds {reject_px:.0f} px. The stump marks are not consistent — "
-            "re-tap the four corners of each stump cluster more precisely."
-        )
-    if pose.reproj_error_px > 8.0:
-        warnings.append(
-            f"High reprojection error ({pose.reproj_error_px:.1f} px) — "
-            "calibration accuracy may be poor; re-tap the stump corners precisely."
+        # Physical-plausibility invariants. A phone is held above the pitch (cam_z>0)
+        # and never sits more than a few metres up. If either is violated, the pose
+        # may have fitted a mirrored or otherwise non-physical twin; refuse to use
+        # it for the 3D reconstruction rather than silently emitting garbage.
+        cam_z = float(pose.cam_center_world.flatten()[2])
+        if not (0.10 <= cam_z <= 5.0):
+            raise CalibrationError(
+                f"Calibration rejected: recovered camera height {cam_z:.2f} m is "
+                "outside the plausible phone range (0.10–5.00 m). The marks likely "
+                "form a mirror twin; re-mark them in the canonical order "
+                "(striker before bowler, base before top)."
+            )
+        if not (1.5 <= pitch_length_m <= 25.0):
+            raise CalibrationError(
+                f"Calibration rejected: derived pitch length {pitch_length_m:.2f} m "
+                "is outside the plausible range (1.5–25.0 m). The stump marks may "
+                "be at very different image scales — re-mark them."
+            )
+        _log.info(
+            "calibration ok: reproj=%.2fpx length=%.2fm cam=(%.2f,%.2f,%.2f) fx=%.0f",
+            pose.reproj_error_px,
+            pitch_length_m,
+            float(pose.cam_center_world.flatten()[0]),
+            float(pose.cam_center_world.flatten()[1]),
+            cam_z,
+            pose.fx,
         )
 
-    # Physical-plausibility invariants. A phone is held above the pitch (cam_z>0)
-    # and never sits more than a few metres up. If either is violated, the pose
-    # may have fitted a mirrored or otherwise non-physical twin; refuse to use
-    # it for the 3D reconstruction rather than silently emitting garbage.
-    cam_z = float(pose.cam_center_world.flatten()[2])
-    if not (0.10 <= cam_z <= 5.0):
-        raise CalibrationError(
-            f"Calibration rejected: recovered camera height {cam_z:.2f} m is "
-            "outside the plausible phone range (0.10–5.00 m). The marks likely "
-            "form a mirror twin; re-mark them in the canonical order "
-            "(striker before bowler, base before top)."
-        )
-    if not (1.5 <= pitch_length_m <= 25.0):
-        raise CalibrationError(
-            f"Calibration rejected: derived pitch length {pitch_length_m:.2f} m "
-            "is outside the plausible range (1.5–25.0 m). The stump marks may "
-            "be at very different image scales — re-mark them."
+        # Score: 1.0 at 0 px error, 0.0 at >=20 px.
+        cal_score = float(max(0.05, min(0.99, 1.0 - pose.reproj_error_px / 20.0)))
+        # ----------------------------- detect + trajectory -----------------------------
+        _progress(progress, 40, "tracking")
+
+        roi_mask = build_pitch_roi_mask(frame0.shape, pitch_corners_px)
+        image_diag = math.hypot(width, height)
+
+        # Detector selection. The motion+colour detector is reliable on clean
+        # (e.g. synthetic) footage but collapses on cluttered real phone clips,
+        # where moving people produce more motion than the ball. A learned YOLO
+        # detector isolates the ball directly and is far more robust there. The
+        # default mode is "auto": run both available detectors and keep whichever
+        # yields the more ball-like track. Explicit "yolo"/"combined" force one.
+        # YOLO runs without the pitch ROI mask — it already rejects non-ball pixels
+        # and the airborne arc rises out of the pitch quad.
+        detector_kind = str(track_req.get("detector") or "auto").lower()
+        # Weights are resolved server-side only. A request must never choose the
+        # file loaded here: ultralytics.YOLO() on a .pt runs torch.load (pickle),
+        # so an attacker-controlled path would be arbitrary code execution. Any
+        # ``yolo_weights`` in the request is ignored.
+        yolo_weights = os.environ.get("POCKET_DRS_YOLO_WEIGHTS") or _default_yolo_weights()
+
+        # Every detector the mode calls for, as (label, detector, mask). They
+        # all consume the same single decode pass below.
+        runs: list[tuple[str, object, np.ndarray | None]] = []
+        if detector_kind == "yolo":
+            if not yolo_weights:
+                raise ValueError("tracking.detector='yolo' requires tracking.yolo_weights")
+            detector = YoloBallDetector(str(yolo_weights), conf=float(track_req.get("yolo_conf", 0.2)))
+            runs.append(("yolo", detector, None))
+        elif detector_kind == "combined":
+            runs.append((ball_color, CombinedBallDetector(ball_color=ball_color), roi_mask))
+        else:  # "auto"
+            # Try every detector we have and pick the most ball-like track. The
+            # caller-supplied ``ball_color`` is the first colour-detector seed;
+            # we also run the alternate colour so a clip with a non-default
+            # ball (white in lights, pink ball, etc.) is not rejected just
+            # because the request did not specify it.
+            seeds = [ball_color] + [c for c in ("red", "pink") if c != ball_color]
+            # The seeds differ only in colour; they share one motion model
+            # and one HSV conversion per frame.
+            motion = SharedMotionDetector()
+            hsv = SharedHsvFrame()
+            for colour in seeds:
+                try:
+                    detector = CombinedBallDetector(ball_color=colour, motion=motion, hsv=hsv)
+                    runs.append((colour, detector, roi_mask))
+                except Exception as e:  # noqa: BLE001
+                    warnings.append(f"Colour detector '{colour}' failed: {e}")
+            if yolo_weights:
+                try:
+                    detector = YoloBallDetector(str(yolo_weights), conf=float(track_req.get("yolo_conf", 0.2)))
+                    runs.append(("yolo", detector, None))
+                except Exception as e:  # noqa: BLE001 — missing ultralytics/torch or bad weights
+                    warnings.append(f"Learned detector unavailable, used motion+colour ({e})")
+
+        run_detections = _detect_stream(
+            itertools.chain([(frame0_t_ms, frame0)], frames),
+            [(det, mask) for _, det, mask in runs],
+            n_frames=len(times_ms),
+            progress=progress,
         )
-    _log.info(
-        "calibration ok: reproj=%.2fpx length=%.2fm cam=(%.2f,%.2f,%.2f) fx=%.0f",
-        pose.reproj_error_px,
-        pitch_length_m,
-        float(pose.cam_center_world.flatten()[0]),
-        float(pose.cam_center_world.flatten()[1]),
-        cam_z,
-        pose.fx,
-    )
 
-    # Score: 1.0 at 0 px error, 0.0 at >=20 px.
-    cal_score = float(max(0.05, min(0.99, 1.0 - pose.reproj_error_px / 20.0)))
-
-    # ----------------------------- detect + trajectory -----------------------------
-    _progress(progress, 40, "tracking")
-
-    roi_mask = build_pitch_roi_mask(frames[0].shape, pitch_corners_px)
-    image_diag = math.hypot(width, height)
-
-    # Detector selection. The motion+colour detector is reliable on clean
-    # (e.g. synthetic) footage but collapses on cluttered real phone clips,
-    # where moving people produce more motion than the ball. A learned YOLO
-    # detector isolates the ball directly and is far more robust there. The
-    # default mode is "auto": run both available detectors and keep whichever
-    # yields the more ball-like track. Explicit "yolo"/"combined" force one.
-    # YOLO runs without the pitch ROI mask — it already rejects non-ball pixels
-    # and the airborne arc rises out of the pitch quad.
-    detector_kind = str(track_req.get("detector") or "auto").lower()
-    # Weights are resolved server-side only. A request must never choose the
-    # file loaded here: ultralytics.YOLO() on a .pt runs torch.load (pickle),
-    # so an attacker-controlled path would be arbitrary code execution. Any
-    # ``yolo_weights`` in the request is ignored.
-    yolo_weights = os.environ.get("POCKET_DRS_YOLO_WEIGHTS") or _default_yolo_weights()
-
-    def _track_with(detector, detect_mask) -> tuple[list[tuple[int, list[dict]]], object | None]:
-        dets_pf: list[tuple[int, list[dict]]] = []
-        for i, frame in enumerate(frames):
-            # Cap candidates per frame so RANSAC seed pairs stay bounded.
-            dets_pf.append((times_ms[i], detector.detect(frame, detect_mask)[:8]))
+    def _track_with(dets_pf: list[tuple[int, list[dict]]]) -> tuple[list[tuple[int, list[dict]]], object | None]:
         fit_ = find_ball_trajectory(dets_pf, image_diagonal_px=image_diag, min_inliers=6)
         return dets_pf, fit_
 
@@ -826,10 +1042,7 @@ def run_pipeline(
         fit_ = result[1]
         if fit_ is None or len(fit_.points) < 2:
             return (-1.0, 0, 0.0)
-        xs = [p.x_px for p in fit_.points]
-        ys = [p.y_px for p in fit_.points]
-        span = math.hypot(max(xs) - min(xs), max(ys) - min(ys))
-        return (span, fit_.inliers, -fit_.rms_px)
+        return (_track_span(fit_), fit_.inliers, -fit_.rms_px)
 
     def _track_span(fit_) -> float:
         if fit_ is None or not getattr(fit_, "points", None):
@@ -859,39 +1072,29 @@ def run_pipeline(
         tight = colour_fit.rms_px <= 0.007 * image_diag
         return longer and tight
 
-    def _combined_result() -> tuple[list[tuple[int, list[dict]]], object | None]:
-        return _track_with(CombinedBallDetector(ball_color=ball_color), roi_mask)
-
-    if detector_kind == "yolo":
-        if not yolo_weights:
-            raise ValueError("tracking.detector='yolo' requires tracking.yolo_weights")
-        detector = YoloBallDetector(str(yolo_weights), conf=float(track_req.get("yolo_conf", 0.2)))
-        detections_per_frame, fit = _track_with(detector, None)
-    elif detector_kind == "combined":
-        detections_per_frame, fit = _combined_result()
-    else:  # "auto"
-        # Try every detector we have and pick the most ball-like track. The
-        # caller-supplied ``ball_color`` is the first colour-detector seed;
-        # we also run the alternate colour so a clip with a non-default
-        # ball (white in lights, pink ball, etc.) is not rejected just
-        # because the request did not specify it.
+    if detector_kind != "auto":
+        # An explicitly forced detector has no fallback: surface its failure.
+        dets_or_exc = run_detections[0]
+        if isinstance(dets_or_exc, Exception):
+            raise dets_or_exc
+        detections_per_frame, fit = _track_with(dets_or_exc)
+    else:
         candidates_results: list[tuple[list, object | None]] = []
-        seeds = [ball_color] + [c for c in ("red", "pink") if c != ball_color]
-        for colour in seeds:
-            try:
-                candidates_results.append(
-                    _track_with(CombinedBallDetector(ball_color=colour), roi_mask)
-                )
-            except Exception as e:  # noqa: BLE001
-                warnings.append(f"Colour detector '{colour}' failed: {e}")
         yolo_result: tuple[list, object | None] | None = None
-        if yolo_weights:
+        for (label, _, _), dets_or_exc in zip(runs, run_detections):
             try:
-                detector = YoloBallDetector(str(yolo_weights), conf=float(track_req.get("yolo_conf", 0.2)))
-                yolo_result = _track_with(detector, None)
-                candidates_results.append(yolo_result)
-            except Exception as e:  # noqa: BLE001 — missing ultralytics/torch or bad weights
-                warnings.append(f"Learned detector unavailable, used motion+colour ({e})")
+                if isinstance(dets_or_exc, Exception):
+                    raise dets_or_exc
+                result_ = _track_with(dets_or_exc)
+            except Exception as e:  # noqa: BLE001
+                if label == "yolo":
+                    warnings.append(f"Learned detector unavailable, used motion+colour ({e})")
+                else:
+                    warnings.append(f"Colour detector '{label}' failed: {e}")
+                continue
+            candidates_results.append(result_)
+            if label == "yolo":
+                yolo_result = result_
         # The ball-specific YOLO track is the trusted default: colour/motion
         # ranks by image span, and a near-camera bowler's run-up (large, fast
         # foreground motion) can out-span the small, far real ball, so plain
@@ -950,10 +1153,14 @@ def run_pipeline(
         # Track the live delivery up to the bat/pad impact (the direction
         # change), then predict the rest. A bounce is kept (the ball plays on);
         # only a genuine interception truncates the tracked flight.
-        impact_i = _detect_impact_frame(fit.points)
+        # The track as one array, built once for the event detectors and
+        # payloads below.
+        track = _track_array(fit.points)
+        impact_i = _detect_impact_frame(track["t_ms"], track["u"])
         if impact_i is not None and impact_i + 1 < 6:
             impact_i = None
         live_points = fit.points if impact_i is None else fit.points[: impact_i + 1]
+        live_rows = track[: len(live_points)].tolist()
         if impact_i is not None:
             warnings.append(
                 "Ball intercepted (direction change) — tracked the delivery to "
@@ -972,9 +1179,8 @@ def run_pipeline(
         extension = _extend_track_to_direction_change(detections_per_frame, live_points)
 
         image_points_payload = [
-            {"t_ms": p.t_ms, "u": p.x_px, "v": p.y_px,
-             "radius_px": p.radius_px, "confidence": p.confidence}
-            for p in live_points
+            {"t_ms": t, "u": u, "v": v, "radius_px": r, "confidence": c}
+            for t, u, v, r, c in live_rows
         ]
         image_points_payload.extend(extension)
         track_payload = {
@@ -986,13 +1192,9 @@ def run_pipeline(
 
         # ----------------------------- 3D reconstruction -----------------------------
         _progress(progress, 65, "reconstruction")
-        det_for_recon = [
-            (p.t_ms, p.x_px, p.y_px, p.radius_px, p.confidence)
-            for p in live_points
-        ]
         recon = reconstruct_trajectory(
             pose=pose,
-            detections=det_for_recon,
+            detections=live_rows,
             pitch_length_m=pitch_length_m,
             pitch_width_m=pitch_width_m,
             # With a stump-anchored pose the gravity-constrained linear solver
@@ -1041,10 +1243,17 @@ def run_pipeline(
                 "predicted_to_stumps_m": [],
             }
 
+            # The solver's bounce/impact world points, looked up once for the
+            # markers, the stump-plane fallback and the event payload below.
+            bounce_wp = (
+                recon.world_points[recon.bounce_index] if recon.bounce_index is not None else None
+            )
+            impact_wp = (
+                recon.world_points[recon.impact_index] if recon.impact_index is not None else None
+            )
             bounce_t_ms_fallback: float | None = None
-            if recon.bounce_index is not None:
-                bp = recon.world_points[recon.bounce_index]
-                bounce_world = (bp.x_m, bp.y_m, bp.z_m)
+            if bounce_wp is not None:
+                bounce_world = (bounce_wp.x_m, bounce_wp.y_m, bounce_wp.z_m)
             else:
                 # Fall-back: the projectile fit does not commit to a bounce
                 # when the post-bounce arc is only one or two frames long
@@ -1057,7 +1266,7 @@ def run_pipeline(
                 # over at least two frames, otherwise an isolated detection
                 # dropout near the end of the clip would masquerade as a
                 # bounce.
-                peak_idx = _find_image_v_peak(live_points, min_post_frames=1)
+                peak_idx = _find_image_v_peak(track["v"][: len(live_points)], min_post_frames=1)
                 if peak_idx is not None and 0 <= peak_idx < len(recon.world_points):
                     wp = recon.world_points[peak_idx]
                     # Pin z to the ball-on-ground height — the v-peak is a
@@ -1067,9 +1276,8 @@ def run_pipeline(
                     # the pitch instead of floating mid-air.
                     bounce_world = (wp.x_m, wp.y_m, BALL_RADIUS_M)
                     bounce_t_ms_fallback = float(wp.t_ms)
-            if recon.impact_index is not None:
-                ip = recon.world_points[recon.impact_index]
-                impact_world = (ip.x_m, ip.y_m, ip.z_m)
+            if impact_wp is not None:
+                impact_world = (impact_wp.x_m, impact_wp.y_m, impact_wp.z_m)
 
             # Decide bowling direction by sign of vx in the fit.
             target_x_m = 0.0 if recon.fit.vx < 0 else pitch_length_m
@@ -1101,17 +1309,16 @@ def run_pipeline(
                 last = predicted_path[-1]
                 y_at_stumps = last[2]
                 z_at_stumps = last[3]
-            elif recon.impact_index is not None:
+            elif impact_wp is not None:
                 # Linear extrapolation from impact along the same trajectory.
-                ip = recon.world_points[recon.impact_index]
-                y_at_stumps = ip.y_m
-                z_at_stumps = ip.z_m
+                y_at_stumps = impact_wp.y_m
+                z_at_stumps = impact_wp.z_m
             else:
                 y_at_stumps = z_at_stumps = None
 
             bounce_t_ms_evt: int | None = None
-            if recon.bounce_index is not None:
-                bounce_t_ms_evt = int(recon.world_points[recon.bounce_index].t_ms)
+            if bounce_wp is not None:
+                bounce_t_ms_evt = int(bounce_wp.t_ms)
             elif bounce_world is not None:
                 bounce_t_ms_evt = int(bounce_t_ms_fallback) if bounce_t_ms_fallback is not None else None
             events_payload = {
@@ -1121,7 +1328,7 @@ def run_pipeline(
                     "y_m": float(bounce_world[1]) if bounce_world else None,
                 },
                 "impact": {
-                    "t_ms": int(recon.world_points[recon.impact_index].t_ms) if recon.impact_index is not None else None,
+                    "t_ms": int(impact_wp.t_ms) if impact_wp is not None else None,
                     "x_m": float(impact_world[0]) if impact_world else None,
                     "y_m": float(impact_world[1]) if impact_world else None,
                     "z_m": float(impact_world[2]) if impact_world else None,
@@ -1163,8 +1370,8 @@ def run_pipeline(
                     else None
                 ),
                 impact=(
-                    (float(recon.world_points[recon.impact_index].t_ms), *impact_world)
-                    if recon.impact_index is not None and impact_world is not None
+                    (float(impact_wp.t_ms), *impact_world)
+                    if impact_wp is not None
                     else None
                 ),
                 image_points=image_points_payload,
@@ -1223,11 +1430,12 @@ def run_pipeline(
     # disk, the API, or the 3D viewer — see _finite_or_none.
     result = _finite_or_none(result)
 
-    try:
-        (artifacts_dir / "result_debug.json").write_text(json.dumps(result, indent=2, default=str))
-    except Exception:
-        pass
+    # Debug-only dump: encoded and written in the background, not awaited.
+    _write_artifact_async(artifacts_dir / "result_debug.json", lambda: _dumps_json(result))
 
+    # frame0.jpg is the image the client taps on; it must exist once the job
+    # reports done.
+    frame0_write.result()
     _progress(progress, 100, "done")
     return PipelineOutput(result=result, warnings=warnings)
 
@@ -36,8 +36,10 @@ fitted velocities and a per-point confidence based on residual to the fit.
 
 from __future__ import annotations
 
+import bisect
 import math
 from dataclasses import dataclass
+from functools import cached_property
 
 import cv2
 import numpy as np
@@ -69,6 +71,13 @@ class CameraPose:
     reproj_error_px: float
     notes: list[str]
 
+    @cached_property
+    def projection(self) -> np.ndarray:
+        """3x4 ``K [R | t]``, built once per pose: a world point ``P`` images
+        at ``h = M @ P + m`` with ``(u, v) = h[:2] / h[2]`` and ``h[2]`` its
+        camera depth."""
+        return self.K @ np.hstack([self.R, self.tvec.reshape(3, 1)])
+
 
 @dataclass(frozen=True)
 class WorldPoint:
@@ -211,24 +220,29 @@ def solve_camera_pose_from_stumps(
     )
     half_w = float(pitch_width_m) / 2.0
 
-    def _solve_at(K: np.ndarray, length: float, use_corners: bool) -> tuple | None:
-        L = float(length)
+    def _correspondences(use_corners: bool) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Object/image point arrays for one sweep, plus the mask of object
+        rows at the bowler end. Only those rows' X (the pitch length) varies
+        between candidates, so the sweep writes it in place."""
         striker_obj = [(0.0, dy, dz) for (dy, dz) in side_template]
-        bowler_obj = [(L, dy, dz) for (dy, dz) in side_template]
-        stump_obj = np.array(striker_obj + bowler_obj, dtype=np.float64)
+        rows = striker_obj + striker_obj
+        img = stump_img
         if use_corners and corner_img is not None:
             # Pitch corners: striker-left, striker-right, bowler-right, bowler-left.
             # Y sign matches the calibration UI's tap convention.
-            corner_obj = np.array(
-                [(0.0, -half_w, 0.0), (0.0,  half_w, 0.0),
-                 (L,    half_w, 0.0), (L,   -half_w, 0.0)],
-                dtype=np.float64,
-            )
-            obj = np.concatenate([stump_obj, corner_obj], axis=0)
+            rows += [(0.0, -half_w, 0.0), (0.0, half_w, 0.0),
+                     (0.0, half_w, 0.0), (0.0, -half_w, 0.0)]
             img = np.concatenate([stump_img, corner_img], axis=0)
-        else:
-            obj = stump_obj
-            img = stump_img
+        far_end = np.zeros(len(rows), dtype=bool)
+        far_end[4:8] = True
+        far_end[10:] = True
+        return np.array(rows, dtype=np.float64), img, far_end
+
+    def _solve_at(
+        K: np.ndarray, length: float, obj: np.ndarray, img: np.ndarray, far_end: np.ndarray,
+    ) -> tuple | None:
+        L = float(length)
+        obj[far_end, 0] = L
         ok, rvec, tvec = cv2.solvePnP(obj, img, K, dist, flags=cv2.SOLVEPNP_SQPNP)
         if not ok:
             return None
@@ -269,10 +283,11 @@ def solve_camera_pose_from_stumps(
     def _sweep(use_corners: bool) -> tuple | None:
         best_local = None
         best_fov_local = None
+        obj, img, far_end = _correspondences(use_corners)
         for fov in fov_candidates:
             K_local = estimate_intrinsics(width, height, h_fov_deg=fov)
             for length in length_candidates:
-                cand = _solve_at(K_local, length, use_corners=use_corners)
+                cand = _solve_at(K_local, length, obj, img, far_end)
                 if cand is None:
                     continue
                 if best_local is None or cand[0] < best_local[0]:
@@ -416,6 +431,35 @@ def detection_to_world(
     return world, float(depth)
 
 
+def detections_to_world(
+    pose: CameraPose,
+    us: np.ndarray,
+    vs: np.ndarray,
+    radii_px: np.ndarray,
+    ball_radius_m: float = BALL_RADIUS_M,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Batch :func:`detection_to_world`: ``(world (N, 3), depth (N,))``.
+
+    Rows whose radius is unusable for depth-from-size (< 0.5 px, NaN) come
+    back as NaN instead of raising, so callers filter with ``np.isfinite``.
+    """
+    us = np.asarray(us, dtype=np.float64)
+    vs = np.asarray(vs, dtype=np.float64)
+    radii = np.asarray(radii_px, dtype=np.float64)
+    ok = radii >= 0.5
+    depth = np.full(radii.shape, np.nan)
+    depth[ok] = (pose.fx * ball_radius_m) / radii[ok]
+    # Same optical-axis scaling as the scalar path: the camera-frame point is
+    # the pixel's normalised ray with its z-component set to ``depth``.
+    point_cam = np.empty((radii.shape[0], 3), dtype=np.float64)
+    point_cam[:, 0] = (us - pose.cx) / pose.fx
+    point_cam[:, 1] = (vs - pose.cy) / pose.fy
+    point_cam[:, 2] = 1.0
+    point_cam *= depth[:, None]
+    world = (point_cam - pose.tvec.reshape(1, 3)) @ pose.R_inv.T
+    return world, depth
+
+
 # ---------------------------------------------------------------------------
 # Projectile-motion fit
 # ---------------------------------------------------------------------------
@@ -591,12 +635,23 @@ def solve_bounce_trajectory_linear(
 
     best: ProjectileFit | None = None
     best_rms_px = float("inf")
+    det_times = [d[0] for d in dets]
+    tried_splits: set[int] = set()
 
     for frac in np.linspace(0.25, 0.75, 11):
         t_b_s = frac * total_s
         t_b_ms = t0_ms + t_b_s * 1000.0
-        pre = [d for d in dets if d[0] <= t_b_ms]
-        post = [d for d in dets if d[0] > t_b_ms]
+        # Detections are time-sorted, so the pre-bounce set is a prefix.
+        # Neighbouring candidate times that fall between the same two
+        # detections give the same split and identical solves; the earliest
+        # such candidate would win the strict comparison below anyway, so the
+        # repeats are skipped.
+        n_pre = bisect.bisect_right(det_times, t_b_ms)
+        if n_pre in tried_splits:
+            continue
+        tried_splits.add(n_pre)
+        pre = dets[:n_pre]
+        post = dets[n_pre:]
         if len(pre) < 3 or len(post) < 3:
             continue
         pre_res = solve_projectile_linear(pose, pre, gravity=gravity)
@@ -701,39 +756,31 @@ def solve_projectile_linear(
     fx, fy, cx, cy = pose.fx, pose.fy, pose.cx, pose.cy
 
     t0_ms = detections[0][0]
-    rows: list[np.ndarray] = []
-    rhs: list[float] = []
-
-    for t_ms, u, v, _r, conf in detections:
-        t = (t_ms - t0_ms) / 1000.0
-        w = max(0.05, float(conf)) ** 0.5
-        # Pc_* = a_* . theta + b_*, with theta = [x0,y0,z0,vx,vy,vz].
-        # Xw = x0 + vx t  -> coeffs over theta: [1,0,0,t,0,0]
-        # Yw = y0 + vy t  -> [0,1,0,0,t,0]
-        # Zw = z0 + vz t  -> [0,0,1,0,0,t]   (gravity handled in b)
-        # Pc_row_k = R[k,0]*Xw + R[k,1]*Yw + R[k,2]*Zw + T[k]
-        g_off = -0.5 * gravity * t * t  # gravity contribution to Zw
-        a = np.zeros((3, 6), dtype=float)
-        b = np.zeros(3, dtype=float)
-        for k in range(3):
-            a[k, 0] = R[k, 0]
-            a[k, 1] = R[k, 1]
-            a[k, 2] = R[k, 2]
-            a[k, 3] = R[k, 0] * t
-            a[k, 4] = R[k, 1] * t
-            a[k, 5] = R[k, 2] * t
-            b[k] = R[k, 2] * g_off + T[k]
-        a_x, a_y, a_z = a[0], a[1], a[2]
-        b_x, b_y, b_z = b[0], b[1], b[2]
-        # u constraint
-        rows.append(w * ((u - cx) * a_z - fx * a_x))
-        rhs.append(w * (fx * b_x - (u - cx) * b_z))
-        # v constraint
-        rows.append(w * ((v - cy) * a_z - fy * a_y))
-        rhs.append(w * (fy * b_y - (v - cy) * b_z))
-
-    A = np.asarray(rows, dtype=float)
-    bb = np.asarray(rhs, dtype=float)
+    det = np.array([d[:5] for d in detections], dtype=float)
+    t = (det[:, 0] - t0_ms) / 1000.0
+    du = det[:, 1] - cx
+    dv = det[:, 2] - cy
+    w = np.sqrt(np.maximum(0.05, det[:, 4]))[:, None]
+    # Pc_* = a_* . theta + b_*, with theta = [x0,y0,z0,vx,vy,vz].
+    # Xw = x0 + vx t  -> coeffs over theta: [1,0,0,t,0,0]
+    # Yw = y0 + vy t  -> [0,1,0,0,t,0]
+    # Zw = z0 + vz t  -> [0,0,1,0,0,t]   (gravity handled in b)
+    # Pc_row_k = R[k,0]*Xw + R[k,1]*Yw + R[k,2]*Zw + T[k]
+    # so per observation a is (3, 6) = [R | R t] and b = R[:, 2] g_off + T.
+    g_off = -0.5 * gravity * t * t  # gravity contribution to Zw
+    a = np.empty((len(t), 3, 6), dtype=float)
+    a[:, :, :3] = R
+    a[:, :, 3:] = R[None, :, :] * t[:, None, None]
+    b = g_off[:, None] * R[:, 2][None, :] + T[None, :]
+    a_x, a_y, a_z = a[:, 0], a[:, 1], a[:, 2]
+    b_x, b_y, b_z = b[:, 0], b[:, 1], b[:, 2]
+    # One u and one v constraint per observation, interleaved.
+    A = np.empty((2 * len(t), 6), dtype=float)
+    bb = np.empty(2 * len(t), dtype=float)
+    A[0::2] = w * (du[:, None] * a_z - fx * a_x)
+    bb[0::2] = w[:, 0] * (fx * b_x - du * b_z)
+    A[1::2] = w * (dv[:, None] * a_z - fy * a_y)
+    bb[1::2] = w[:, 0] * (fy * b_y - dv * b_z)
     try:
         theta, *_ = np.linalg.lstsq(A, bb, rcond=None)
     except np.linalg.LinAlgError:
@@ -743,23 +790,15 @@ def solve_projectile_linear(
 
     x0, y0, z0, vx, vy, vz = (float(v) for v in theta)
 
-    # Reprojection RMS in pixels.
-    sq = 0.0
-    n = 0
-    for t_ms, u, v, _r, _conf in detections:
-        t = (t_ms - t0_ms) / 1000.0
-        xw = x0 + vx * t
-        yw = y0 + vy * t
-        zw = z0 + vz * t - 0.5 * gravity * t * t
-        proj = _project_world(pose, xw, yw, zw)
-        if proj is None:
-            sq += 1e6
-            n += 1
-            continue
-        up, vp, _ = proj
-        sq += (u - up) ** 2 + (v - vp) ** 2
-        n += 1
-    rms_px = float(math.sqrt(sq / max(1, n)))
+    # Reprojection RMS in pixels; a point behind the camera scores 1e6.
+    xyz = np.empty((len(t), 3), dtype=float)
+    xyz[:, 0] = x0 + vx * t
+    xyz[:, 1] = y0 + vy * t
+    xyz[:, 2] = z0 + vz * t - 0.5 * gravity * t * t
+    uv, _depth, ok = _project_world_many(pose, xyz)
+    sq_px = (det[:, 1] - uv[:, 0]) ** 2 + (det[:, 2] - uv[:, 1]) ** 2
+    sq = float(np.where(ok, sq_px, 1e6).sum())
+    rms_px = float(math.sqrt(sq / max(1, len(t))))
 
     return (
         ProjectileFit(
@@ -788,6 +827,24 @@ def _project_world(pose: CameraPose, x: float, y: float, z: float) -> tuple[floa
     return float(u), float(v), depth
 
 
+def _project_world_many(
+    pose: CameraPose, xyz: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Batch form of :func:`_project_world` for an ``(N, 3)`` array of world points.
+
+    Returns ``(uv, depth, ok)``: ``uv`` is ``(N, 2)`` pixels and ``ok`` masks the
+    points in front of the camera (same depth cut-off as the scalar path). Rows
+    where ``ok`` is False hold garbage and must not be read.
+    """
+    pts = np.asarray(xyz, dtype=np.float64).reshape(-1, 3)
+    proj = pose.projection
+    h = pts @ proj[:, :3].T + proj[:, 3]
+    depth = h[:, 2]
+    ok = depth > 0.05
+    uv = h[:, :2] / np.where(ok, depth, 1.0)[:, None]
+    return uv, depth, ok
+
+
 def _bounce_eval(
     fit: ProjectileFit,
 ) -> tuple[float, float, float, float, float, float] | None:
@@ -822,14 +879,18 @@ def _bounce_eval(
     return (t_b, xb, yb, vx_post, vy_post, vz_post)
 
 
-def _eval_fit_at(fit: ProjectileFit, t_s: float) -> tuple[float, float, float]:
+def _eval_fit_at(
+    fit: ProjectileFit,
+    t_s: float,
+    be: tuple[float, float, float, float, float, float] | None,
+) -> tuple[float, float, float]:
     """Evaluate the bounce-aware projectile position at time ``t_s``.
 
     The one evaluator shared by the flight overlay, the forward prediction and
     the smoothing pass, so all three render the identical physical trajectory
-    (including any measured post-bounce deviation).
+    (including any measured post-bounce deviation). ``be`` is the fit's
+    :func:`_bounce_eval`, passed in so a caller evaluates it once per fit.
     """
-    be = _bounce_eval(fit)
     if be is not None and t_s >= be[0]:
         t_g, xb, yb, vxp, vyp, vzp = be
         tp = t_s - t_g
@@ -843,6 +904,24 @@ def _eval_fit_at(fit: ProjectileFit, t_s: float) -> tuple[float, float, float]:
     return x, y, z
 
 
+def _eval_fit_at_many(fit: ProjectileFit, ts: np.ndarray) -> np.ndarray:
+    """Vectorised :func:`_eval_fit_at` over an array of times; returns ``(N, 3)``."""
+    ts = np.asarray(ts, dtype=float)
+    out = np.empty((ts.shape[0], 3), dtype=float)
+    out[:, 0] = fit.x0 + fit.vx * ts
+    out[:, 1] = fit.y0 + fit.vy * ts
+    out[:, 2] = np.maximum(0.0, fit.z0 + fit.vz * ts - 0.5 * GRAVITY_MS2 * ts * ts)
+    be = _bounce_eval(fit)
+    if be is not None:
+        t_g, xb, yb, vxp, vyp, vzp = be
+        post = ts >= t_g
+        tp = ts[post] - t_g
+        out[post, 0] = xb + vxp * tp
+        out[post, 1] = yb + vyp * tp
+        out[post, 2] = np.maximum(0.0, vzp * tp - 0.5 * GRAVITY_MS2 * tp * tp)
+    return out
+
+
 def _projectile_at(params: np.ndarray, t_s: float, *, has_bounce: bool, t_b: float | None,
                    restitution: float = COEFFICIENT_OF_RESTITUTION_Z) -> tuple[float, float, float]:
     """Compute (x, y, z) from 6-param projectile state at time t_s.
@@ -886,6 +965,80 @@ def _projectile_at(params: np.ndarray, t_s: float, *, has_bounce: bool, t_b: flo
     return x, y, z
 
 
+def _ground_time(z0: float, vz: float, t_b: float) -> tuple[float, float, float]:
+    """Pre-bounce ground-touch time as used by :func:`_projectile_at`.
+
+    Returns ``(t_ground, dt/dz0, dt/dvz)``; the derivatives are zero on the
+    fallback branch, where the time is pinned to the ``t_b`` hint.
+    """
+    disc = vz * vz + 2.0 * GRAVITY_MS2 * max(z0, 0.0)
+    if disc > 0 and z0 > 0:
+        root = math.sqrt(disc)
+        t_ground = (vz + root) / GRAVITY_MS2
+        if t_ground > 0:
+            return t_ground, 1.0 / root, (1.0 + vz / root) / GRAVITY_MS2
+    return max(t_b, 0.01), 0.0, 0.0
+
+
+def _projectile_at_many(params: np.ndarray, ts: np.ndarray, *, has_bounce: bool, t_b: float | None,
+                        restitution: float = COEFFICIENT_OF_RESTITUTION_Z) -> np.ndarray:
+    """Vectorised :func:`_projectile_at` over an array of times; returns ``(N, 3)``."""
+    x0, y0, z0, vx, vy, vz = (float(v) for v in params)
+    ts = np.asarray(ts, dtype=float)
+    out = np.empty((ts.shape[0], 3), dtype=float)
+    out[:, 0] = x0 + vx * ts
+    out[:, 1] = y0 + vy * ts
+    out[:, 2] = np.maximum(0.0, z0 + vz * ts - 0.5 * GRAVITY_MS2 * ts * ts)
+    if has_bounce and t_b is not None:
+        # The ground-touch time depends only on the parameters, so it is
+        # solved once here rather than per sample (see _projectile_at).
+        t_ground, _, _ = _ground_time(z0, vz, t_b)
+        post = ts >= t_ground
+        if post.any():
+            vz_post = -restitution * (vz - GRAVITY_MS2 * t_ground)
+            tp = ts[post] - t_ground
+            out[post, 0] = (x0 + vx * t_ground) + vx * tp
+            out[post, 1] = (y0 + vy * t_ground) + vy * tp
+            out[post, 2] = np.maximum(0.0, vz_post * tp - 0.5 * GRAVITY_MS2 * tp * tp)
+    return out
+
+
+def _projectile_jac_many(params: np.ndarray, ts: np.ndarray, *, has_bounce: bool, t_b: float | None,
+                         restitution: float = COEFFICIENT_OF_RESTITUTION_Z) -> np.ndarray:
+    """Analytic ``d(x, y, z)/d(params)`` of :func:`_projectile_at_many`; ``(N, 3, 6)``.
+
+    x and y are ``x0 + vx*t`` on both sides of the bounce (the post-bounce arc
+    restarts from the ground-touch point with the same horizontal velocity),
+    so only z has a bounce-dependent derivative. Clamped samples (z held at 0)
+    have zero z-gradient.
+    """
+    _, _, z0, _, _, vz = (float(v) for v in params)
+    ts = np.asarray(ts, dtype=float)
+    jac = np.zeros((ts.shape[0], 3, 6), dtype=float)
+    jac[:, 0, 0] = 1.0
+    jac[:, 0, 3] = ts
+    jac[:, 1, 1] = 1.0
+    jac[:, 1, 4] = ts
+    live = z0 + vz * ts - 0.5 * GRAVITY_MS2 * ts * ts > 0.0
+    jac[:, 2, 2] = live
+    jac[:, 2, 5] = np.where(live, ts, 0.0)
+    if has_bounce and t_b is not None:
+        t_ground, dg_dz0, dg_dvz = _ground_time(z0, vz, t_b)
+        post = ts >= t_ground
+        if post.any():
+            vz_post = -restitution * (vz - GRAVITY_MS2 * t_ground)
+            tp = ts[post] - t_ground
+            live = vz_post * tp - 0.5 * GRAVITY_MS2 * tp * tp > 0.0
+            # z = vz_post*tp - g*tp^2/2 with tp = t - t_ground(z0, vz).
+            dz_dtg = -(vz_post - GRAVITY_MS2 * tp)
+            dvp_dtg = restitution * GRAVITY_MS2
+            dz_dz0 = (dvp_dtg * dg_dz0) * tp + dz_dtg * dg_dz0
+            dz_dvz = (-restitution + dvp_dtg * dg_dvz) * tp + dz_dtg * dg_dvz
+            jac[post, 2, 2] = np.where(live, dz_dz0, 0.0)
+            jac[post, 2, 5] = np.where(live, dz_dvz, 0.0)
+    return jac
+
+
 def _bundle_adjust_trajectory(
     *,
     pose: CameraPose,
@@ -893,6 +1046,7 @@ def _bundle_adjust_trajectory(
     seed: ProjectileFit,
     radius_weight: float = 0.0,
     pitch_length_m: float | None = None,
+    analytic_jac: bool = True,
 ) -> ProjectileFit | None:
     """Refine the 6 trajectory parameters by minimising pixel + radius residuals.
 
@@ -906,6 +1060,10 @@ def _bundle_adjust_trajectory(
 
     If the seed has a bounce, we keep it as a fixed knot and only refine the
     pre-bounce 6 params (post-bounce trajectory is determined by joint).
+
+    The solver gets the closed-form Jacobian of the residuals; pass
+    ``analytic_jac=False`` to fall back to SciPy's finite differences when
+    debugging a suspected derivative error.
     """
     if not detections:
         return None
@@ -933,43 +1091,83 @@ def _bundle_adjust_trajectory(
             expected_x0 = 0.0
             expected_x_end = pitch_length_m
     t_end_s = float(times_s[-1])
+    has_prior = expected_x0 is not None and expected_x_end is not None
+    n_det = len(detections)
+    radius_ok = rs > 1.0
 
     def residuals(params):
-        out = []
-        for i, t in enumerate(times_s):
-            x, y, z = _projectile_at(params, t, has_bounce=has_bounce, t_b=t_b)
-            proj = _project_world(pose, x, y, z)
-            if proj is None:
-                # Heavy penalty for behind-camera predictions.
-                out.extend([1000.0, 1000.0, 1000.0])
-                continue
-            u_pred, v_pred, depth = proj
-            r_pred = pose.fx * BALL_RADIUS_M / depth
-            # Pixel residual scaled by 1.
-            out.append((us[i] - u_pred) * ws[i])
-            out.append((vs[i] - v_pred) * ws[i])
-            # Radius residual: scaled to be comparable in magnitude to pixel
-            # residuals. depth = fx*R/r, so d(depth)/d(r) = -fx*R/r^2 = -depth/r.
-            # A 1px error in radius corresponds to (depth/r) m error in depth.
-            # We use ratio residual (r_obs/r_pred - 1) which is dimensionless
-            # and comparable to (1px / r_pred) — i.e. the radius-relative noise.
-            if rs[i] > 1.0 and r_pred > 1.0:
-                # Bigger detections give more reliable radius info; weight grows with r.
-                size_w = min(1.0, r_pred / 6.0)
-                out.append(radius_weight * size_w * ws[i] * (rs[i] / r_pred - 1.0))
-            else:
-                out.append(0.0)
+        # One row of (u, v, radius) residuals per detection, flattened, plus
+        # the two traversal-prior terms when they apply.
+        out = np.empty(3 * n_det + (2 if has_prior else 0), dtype=float)
+        rows = out[:3 * n_det].reshape(n_det, 3)
+        xyz = _projectile_at_many(params, times_s, has_bounce=has_bounce, t_b=t_b)
+        uv, depth, ok = _project_world_many(pose, xyz)
+        r_pred = pose.fx * BALL_RADIUS_M / np.where(ok, depth, 1.0)
+        # Pixel residual scaled by 1.
+        rows[:, 0] = (us - uv[:, 0]) * ws
+        rows[:, 1] = (vs - uv[:, 1]) * ws
+        # Radius residual: scaled to be comparable in magnitude to pixel
+        # residuals. depth = fx*R/r, so d(depth)/d(r) = -fx*R/r^2 = -depth/r.
+        # A 1px error in radius corresponds to (depth/r) m error in depth.
+        # We use ratio residual (r_obs/r_pred - 1) which is dimensionless
+        # and comparable to (1px / r_pred) — i.e. the radius-relative noise.
+        # Bigger detections give more reliable radius info; weight grows with r.
+        use_r = radius_ok & (r_pred > 1.0)
+        size_w = np.minimum(1.0, r_pred / 6.0)
+        rows[:, 2] = np.where(use_r, radius_weight * size_w * ws * (rs / r_pred - 1.0), 0.0)
+        # Heavy penalty for behind-camera predictions.
+        rows[~ok] = 1000.0
         # Soft pitch-traversal prior. Pixel residuals dominate, this just
         # nudges the optimiser away from degenerate solutions when the ball
         # moves along the camera axis. A 1m endpoint deviation contributes
         # ~1.5 units, comparable to a small pixel error.
-        if expected_x0 is not None and expected_x_end is not None:
+        if has_prior:
             x_init, _, _ = _projectile_at(params, 0.0, has_bounce=has_bounce, t_b=t_b)
             x_final, _, _ = _projectile_at(params, t_end_s, has_bounce=has_bounce, t_b=t_b)
             prior_weight = 1.5
-            out.append(prior_weight * (x_init - expected_x0))
-            out.append(prior_weight * (x_final - expected_x_end))
-        return np.asarray(out, dtype=float)
+            out[-2] = prior_weight * (x_init - expected_x0)
+            out[-1] = prior_weight * (x_final - expected_x_end)
+        return out
+
+    proj = pose.projection
+    proj_m, proj_t = proj[:, :3], proj[:, 3]
+    radius_k = pose.fx * BALL_RADIUS_M
+
+    def jacobian(params):
+        # Chain rule through the homogeneous image point h = M P + m:
+        # d(residual)/d(params) = d(residual)/dh @ M @ dP/d(params).
+        out = np.zeros((3 * n_det + (2 if has_prior else 0), 6), dtype=float)
+        rows = out[:3 * n_det].reshape(n_det, 3, 6)
+        xyz = _projectile_at_many(params, times_s, has_bounce=has_bounce, t_b=t_b)
+        # dP/d(params) is mostly constant ([1, t] rows for x and y), but one
+        # batched 3x3 @ (N, 3, 6) matmul still beats filling dh column by
+        # column by hand: per-call overhead dominates at these sizes.
+        dh = proj_m @ _projectile_jac_many(params, times_s, has_bounce=has_bounce, t_b=t_b)
+        h = xyz @ proj_m.T + proj_t
+        ok = h[:, 2] > 0.05
+        inv_z = 1.0 / np.where(ok, h[:, 2], 1.0)
+        ddepth = dh[:, 2, :]
+        # u = h0/h2  ->  du = (dh0 - u*dh2)/h2; residual is (u_obs - u)*w.
+        k_w = (-ws * inv_z)[:, None]
+        rows[:, 0, :] = k_w * (dh[:, 0, :] - (h[:, 0] * inv_z)[:, None] * ddepth)
+        rows[:, 1, :] = k_w * (dh[:, 1, :] - (h[:, 1] * inv_z)[:, None] * ddepth)
+        # Radius residual a*size_w*(rs*Z/k - 1) with r_pred = k/Z and
+        # size_w = min(1, r_pred/6).
+        r_pred = radius_k * inv_z
+        use_r = radius_ok & (r_pred > 1.0)
+        capped = r_pred / 6.0 >= 1.0
+        size_w = np.where(capped, 1.0, r_pred / 6.0)
+        dsize_dz = np.where(capped, 0.0, -r_pred * inv_z / 6.0)
+        d_dz = radius_weight * ws * (dsize_dz * (rs / r_pred - 1.0) + size_w * rs / radius_k)
+        rows[:, 2, :] = np.where(use_r, d_dz, 0.0)[:, None] * ddepth
+        # Behind-camera rows carry a constant penalty.
+        rows[~ok] = 0.0
+        if has_prior:
+            # x is x0 + vx*t on both sides of the bounce.
+            out[-2, 0] = 1.5
+            out[-1, 0] = 1.5
+            out[-1, 3] = 1.5 * t_end_s
+        return out
 
     x0_arr = np.array([seed.x0, seed.y0, seed.z0, seed.vx, seed.vy, seed.vz], dtype=float)
 
@@ -981,10 +1179,15 @@ def _bundle_adjust_trajectory(
     upper = np.array([ span,  3.0,  3.5,  50.0,  5.0,  2.0])
     # Clip seed to bounds so the solver starts on a valid point.
     x0_arr = np.clip(x0_arr, lower + 1e-3, upper - 1e-3)
+    # The parameters are metres and m/s of similar magnitude, so the default
+    # unit x_scale is kept; x_scale="jac" measured ~10% more evaluations. The
+    # seed comes from this delivery's own linear solve: deliveries are
+    # independent, so there is no cross-call warm start.
 
     try:
         sol = least_squares(
             residuals, x0_arr,
+            jac=jacobian if analytic_jac else "2-point",
             method="trf",
             bounds=(lower, upper),
             max_nfev=200,
@@ -1006,17 +1209,12 @@ def _bundle_adjust_trajectory(
         p = np.array([seed.x0, seed.y0, seed.z0, seed.vx, seed.vy, seed.vz], dtype=float)
 
     # Compute world RMS for our reporting (recompute residuals in world coords).
-    world_resids = []
-    for i, t in enumerate(times_s):
-        x, y, z = _projectile_at(p, t, has_bounce=has_bounce, t_b=t_b)
-        proj = _project_world(pose, x, y, z)
-        if proj is None:
-            continue
-        # Approximate world error from pixel error via local depth scaling.
-        u_pred, v_pred, depth = proj
-        pix_err = math.hypot(us[i] - u_pred, vs[i] - v_pred)
-        world_resids.append(pix_err * depth / pose.fx)
-    rms_world = float(np.sqrt(np.mean(np.array(world_resids) ** 2))) if world_resids else seed.rms_m
+    uv, depth, ok = _project_world_many(
+        pose, _projectile_at_many(p, times_s, has_bounce=has_bounce, t_b=t_b))
+    # Approximate world error from pixel error via local depth scaling.
+    pix_err = np.hypot(us - uv[:, 0], vs - uv[:, 1])
+    world_resids = (pix_err * depth / pose.fx)[ok]
+    rms_world = float(np.sqrt(np.mean(world_resids ** 2))) if world_resids.size else seed.rms_m
 
     return ProjectileFit(
         x0=float(p[0]), y0=float(p[1]), z0=float(p[2]),
@@ -1084,29 +1282,27 @@ def reconstruct_trajectory(
     pitch laterally) before fitting.
     """
     raw: list[WorldPoint] = []
-    for t_ms, u, v, r, conf in detections:
-        if r < 0.5:
-            continue
-        try:
-            w_xyz, depth = detection_to_world(pose, u=u, v=v, radius_px=r)
-        except Exception:
-            continue
-        x, y, z = float(w_xyz[0]), float(w_xyz[1]), float(w_xyz[2])
-        # Plausibility gate: ball must be roughly on/above the pitch.
-        if not (-3.0 <= x <= pitch_length_m + 3.0):
-            continue
-        if abs(y) > pitch_width_m * 1.5:
-            continue
-        if not (-0.2 <= z <= 4.5):
-            continue
-        if depth <= 0.5 or depth > pitch_length_m + 6.0:
-            continue
-        raw.append(WorldPoint(
-            t_ms=int(t_ms), x_m=x, y_m=y, z_m=z,
-            confidence=float(conf),
-            depth_m=float(depth),
-            radius_px=float(r),
-        ))
+    if detections:
+        det_arr = np.array([d[:5] for d in detections], dtype=np.float64)
+        world, depth = detections_to_world(pose, det_arr[:, 1], det_arr[:, 2], det_arr[:, 3])
+        x, y, z = world[:, 0], world[:, 1], world[:, 2]
+        # Plausibility gate: ball must be roughly on/above the pitch. NaN rows
+        # (unusable radius) fail every comparison and drop out here.
+        with np.errstate(invalid="ignore"):
+            keep = (
+                (-3.0 <= x) & (x <= pitch_length_m + 3.0)
+                & (np.abs(y) <= pitch_width_m * 1.5)
+                & (-0.2 <= z) & (z <= 4.5)
+                & (depth > 0.5) & (depth <= pitch_length_m + 6.0)
+            )
+        for i in np.flatnonzero(keep).tolist():
+            t_ms, _u, _v, r, conf = detections[i]
+            raw.append(WorldPoint(
+                t_ms=int(t_ms), x_m=float(x[i]), y_m=float(y[i]), z_m=float(z[i]),
+                confidence=float(conf),
+                depth_m=float(depth[i]),
+                radius_px=float(r),
+            ))
 
     # ---- Trajectory fit ---------------------------------------------------
     # Two reconstruction routes:
@@ -1241,11 +1437,10 @@ def reconstruct_trajectory(
         # masquerade as a bounce, and keep the latest qualifying peak so a
         # bounce that lands near the end of the tracked arc is preferred
         # over an earlier ambiguous dip.
-        bounce_local_idx: int | None = None
         v_jitter_px = 2.0
-        for i in range(1, len(vs) - 1):
-            if vs[i] > vs[i - 1] + v_jitter_px and vs[i] > vs[i + 1] + v_jitter_px:
-                bounce_local_idx = i
+        mid = vs[1:-1]
+        peaks = np.flatnonzero((mid > vs[:-2] + v_jitter_px) & (mid > vs[2:] + v_jitter_px))
+        bounce_local_idx = int(peaks[-1]) + 1 if peaks.size else None
         if bounce_local_idx is not None:
             t_bounce_ms = float(ts[bounce_local_idx])
             u_b = float(sorted_dets[bounce_local_idx][1])
@@ -1312,32 +1507,33 @@ def reconstruct_trajectory(
         # Replace observations with smoothed projectile values; observations
         # are noisy (depth-from-size has ~10 % noise) but the fit is smooth.
         t0_ms = raw[0].t_ms
-        smoothed = []
-        for p in raw:
-            ts = (p.t_ms - t0_ms) / 1000.0
-            # Same shared evaluator the overlay and prediction use, so the
-            # smoothed world points lie on the identical bounce-aware arc.
-            x_s, y_s, z_s = _eval_fit_at(fit, ts)
-            # Confidence weighted by raw observation conf and inverse-residual.
-            resid = math.sqrt((p.x_m - x_s) ** 2 + (p.y_m - y_s) ** 2 + (p.z_m - z_s) ** 2)
-            tightness = max(0.05, 1.0 - resid / max(0.5, fit.rms_m * 3.0))
-            conf = float(min(1.0, 0.4 * p.confidence + 0.6 * tightness))
-            smoothed.append(WorldPoint(
+        t_ms_arr = np.array([p.t_ms for p in raw], dtype=float)
+        obs = np.array([(p.x_m, p.y_m, p.z_m) for p in raw], dtype=float)
+        # Same shared evaluator the overlay and prediction use, so the
+        # smoothed world points lie on the identical bounce-aware arc.
+        fitted = _eval_fit_at_many(fit, (t_ms_arr - t0_ms) / 1000.0)
+        # Confidence weighted by raw observation conf and inverse-residual.
+        resid = np.sqrt(((obs - fitted) ** 2).sum(axis=1))
+        tightness = np.maximum(0.05, 1.0 - resid / max(0.5, fit.rms_m * 3.0))
+        confs = np.minimum(1.0, 0.4 * np.array([p.confidence for p in raw]) + 0.6 * tightness)
+        smoothed = [
+            WorldPoint(
                 t_ms=p.t_ms, x_m=x_s, y_m=y_s, z_m=z_s,
                 confidence=conf, depth_m=p.depth_m, radius_px=p.radius_px,
-            ))
+            )
+            for p, (x_s, y_s, z_s), conf in zip(raw, fitted.tolist(), confs.tolist())
+        ]
 
         # Bounce index: closest observation to bounce_t_ms (if any).
         if fit.bounce_t_ms is not None:
             target_t = t0_ms + fit.bounce_t_ms
-            bounce_index = int(np.argmin([abs(p.t_ms - target_t) for p in smoothed]))
+            bounce_index = int(np.argmin(np.abs(t_ms_arr - target_t)))
         # Impact = stump-plane intersection: where world X reaches striker
         # crease (X=0) or bowler crease (X=pitch_length).  Use whichever
         # the ball is moving toward.
-        x_first = smoothed[0].x_m
-        x_last = smoothed[-1].x_m
-        target_x = 0.0 if x_last < x_first else pitch_length_m
-        impact_index = int(np.argmin([abs(p.x_m - target_x) for p in smoothed]))
+        xs = fitted[:, 0]
+        target_x = 0.0 if xs[-1] < xs[0] else pitch_length_m
+        impact_index = int(np.argmin(np.abs(xs - target_x)))
 
     return Reconstruction(
         pose=pose,
@@ -1366,14 +1562,14 @@ def predict_path_to_stumps(
     builder's contract.
     """
     impact_s = impact_t_ms / 1000.0
-    x_imp, y_imp, z_imp = _eval_fit_at(fit, impact_s)
+    be = _bounce_eval(fit)
+    x_imp, y_imp, z_imp = _eval_fit_at(fit, impact_s, be)
 
     # Horizontal velocity that governs the continuation, and the vertical speed
     # at impact: post-bounce values when the impact is past the pitch point,
     # pre-bounce otherwise.  Pulling both from the same _bounce_eval the
     # evaluator used guarantees the forecast leaves the impact point along the
     # exact tangent of the drawn flight arc (no kink at the hand-off).
-    be = _bounce_eval(fit)
     if be is not None and impact_s >= be[0]:
         t_g, _xb, _yb, vx_eff, vy_eff, vz_post = be
         vz_at_imp = vz_post - GRAVITY_MS2 * (impact_s - t_g)
@@ -1395,17 +1591,23 @@ def predict_path_to_stumps(
     if dt_to_stumps < 0:
         dt_to_stumps = 0.2
 
+    # Impact to stumps is one closed-form arc; at ~24 samples a plain loop
+    # beats an array pass, so only the loop invariants are hoisted.
+    half_g = 0.5 * GRAVITY_MS2
+    t_imp = float(impact_t_ms)
     out: list[tuple[float, float, float, float]] = []
     for i in range(1, n_steps + 1):
-        s = i / n_steps
-        tp = dt_to_stumps * s
-        x = x_imp + vx_eff * tp
-        y = y_imp + vy_eff * tp
-        z = max(0.0, z_imp + vz_at_imp * tp - 0.5 * GRAVITY_MS2 * tp ** 2)
-        out.append((float(impact_t_ms + tp * 1000.0), x, y, z))
+        tp = dt_to_stumps * (i / n_steps)
+        z = z_imp + vz_at_imp * tp - half_g * tp ** 2
+        out.append((t_imp + tp * 1000.0, x_imp + vx_eff * tp, y_imp + vy_eff * tp, z if z > 0.0 else 0.0))
     return out
 
 
+def _median3(a: float, b: float, c: float) -> float:
+    """Median of three values by comparison, without building a sorted list."""
+    return max(min(a, b), min(max(a, b), c))
+
+
 def _smooth_curve(us: list[float], vs: list[float], n_out: int = 64) -> list[tuple[float, float]] | None:
     """Fit a smoothing spline through image points and resample it densely.
 
@@ -1467,6 +1669,14 @@ def build_overlay_px(
             return None
         return {"u": round(float(p[0]), 2), "v": round(float(p[1]), 2)}
 
+    def proj_many(xyz: list[tuple[float, float, float]] | np.ndarray) -> list[dict | None]:
+        if len(xyz) == 0:
+            return []
+        uv, _depth, ok = _project_world_many(pose, np.asarray(xyz, dtype=np.float64))
+        uv = np.round(uv, 2).tolist()
+        return [{"u": a, "v": b} if good else None
+                for (a, b), good in zip(uv, ok.tolist())]
+
     path: list[dict] = []
     impact_s = max(0.0, float(impact_t_rel_ms) / 1000.0)
     steps = max(2, n_steps)
@@ -1499,19 +1709,18 @@ def build_overlay_px(
             n = len(clean)
             for i, (t, u, v) in enumerate(clean):
                 if 0 < i < n - 1:
-                    u = sorted((clean[i - 1][1], u, clean[i + 1][1]))[1]
-                    v = sorted((clean[i - 1][2], v, clean[i + 1][2]))[1]
+                    u = _median3(clean[i - 1][1], u, clean[i + 1][1])
+                    v = _median3(clean[i - 1][2], v, clean[i + 1][2])
                 path.append({"t_ms": t, "phase": "flight",
                              "u": round(u, 2), "v": round(v, 2)})
     elif impact_s > 1e-3:
-        for i in range(steps + 1):
-            ts = impact_s * i / steps
-            x, y, z = _eval_fit_at(fit, ts)
-            pt = proj(x, y, z)
+        ts_all = [impact_s * i / steps for i in range(steps + 1)]
+        pts = proj_many(_eval_fit_at_many(fit, np.asarray(ts_all)))
+        for ts, pt in zip(ts_all, pts):
             if pt is not None:
                 path.append({"t_ms": int(t0_ms + ts * 1000.0), "phase": "flight", **pt})
-    for (tp, x, y, z) in predicted_path:
-        pt = proj(x, y, z)
+    pts = proj_many([(x, y, z) for (_tp, x, y, z) in predicted_path])
+    for (tp, _x, _y, _z), pt in zip(predicted_path, pts):
         if pt is not None:
             path.append({"t_ms": int(t0_ms + tp), "phase": "predicted", **pt})
 
@@ -1529,36 +1738,34 @@ def build_overlay_px(
     # Pitch corridor: the on-stumps channel on the ground, drawn from the
     # striker stumps up the pitch. A ground rectangle in perspective gives the
     # broadcast "tramline" band that shows the line of the delivery.
-    corridor = [
-        proj(0.0, -corridor_half_m, 0.0),
-        proj(0.0, corridor_half_m, 0.0),
-        proj(pitch_length_m, corridor_half_m, 0.0),
-        proj(pitch_length_m, -corridor_half_m, 0.0),
-    ]
+    corridor = proj_many([
+        (0.0, -corridor_half_m, 0.0),
+        (0.0, corridor_half_m, 0.0),
+        (pitch_length_m, corridor_half_m, 0.0),
+        (pitch_length_m, -corridor_half_m, 0.0),
+    ])
     corridor_px = corridor if all(c is not None for c in corridor) else None
 
     # Full pitch surface polygon — the visible playing strip from striker to
     # bowler ends at the full pitch width. Distinct from the LBW corridor so
     # clients can render the broadcast pitch outline as well as the corridor.
     half_w = float(pitch_width_m) / 2.0
-    pitch_rect = [
-        proj(0.0, -half_w, 0.0),
-        proj(0.0,  half_w, 0.0),
-        proj(pitch_length_m,  half_w, 0.0),
-        proj(pitch_length_m, -half_w, 0.0),
-    ]
+    pitch_rect = proj_many([
+        (0.0, -half_w, 0.0),
+        (0.0,  half_w, 0.0),
+        (pitch_length_m,  half_w, 0.0),
+        (pitch_length_m, -half_w, 0.0),
+    ])
     pitch_rect_px = pitch_rect if all(p is not None for p in pitch_rect) else None
 
     # Stump-to-stump centerline on the ground (the bowling axis), drawn so
     # clients can show the "wickets-to-wickets" line at a glance even when
     # the trajectory is short or the corridor band is hard to see.
     centerline_segments = max(8, int(round(pitch_length_m)) * 2)
-    centerline: list[dict] = []
-    for i in range(centerline_segments + 1):
-        x_m = pitch_length_m * i / centerline_segments
-        p = proj(x_m, 0.0, 0.0)
-        if p is not None:
-            centerline.append(p)
+    centerline = [p for p in proj_many([
+        (pitch_length_m * i / centerline_segments, 0.0, 0.0)
+        for i in range(centerline_segments + 1)
+    ]) if p is not None]
     centerline_px = centerline if len(centerline) >= 2 else None
 
     return {
@@ -16,6 +16,9 @@ fielding positions where false motion is common.
 from __future__ import annotations
 
 import math
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 import cv2
@@ -56,6 +59,10 @@ def _contour_metrics(contour: np.ndarray) -> dict[str, float] | None:
     geometry (the minor axis is the true ball diameter; the major axis encodes
     image-space speed).
     """
+    # A point or a two-vertex segment encloses no area; drop these specks
+    # before any OpenCV call.
+    if len(contour) < 3:
+        return None
     area = float(cv2.contourArea(contour))
     if not (_MIN_AREA_PX <= area <= _MAX_AREA_PX):
         return None
@@ -74,14 +81,6 @@ def _contour_metrics(contour: np.ndarray) -> dict[str, float] | None:
     rect_area = max(1e-3, rw * rh)
     fill = area / rect_area
 
-    moments = cv2.moments(contour)
-    m00 = moments.get("m00", 0.0)
-    if m00 > 0:
-        cx = float(moments["m10"] / m00)
-        cy = float(moments["m01"] / m00)
-    else:
-        cx, cy = float(rc_x), float(rc_y)
-
     is_streak = False
     if circularity >= _MIN_CIRCULARITY:
         # Round-blob path: classic compact ball.
@@ -106,6 +105,16 @@ def _contour_metrics(contour: np.ndarray) -> dict[str, float] | None:
     else:
         return None
 
+    # Moments cost ~10x the area integral, so only accepted shapes pay for the
+    # centroid.
+    moments = cv2.moments(contour)
+    m00 = moments.get("m00", 0.0)
+    if m00 > 0:
+        cx = float(moments["m10"] / m00)
+        cy = float(moments["m01"] / m00)
+    else:
+        cx, cy = float(rc_x), float(rc_y)
+
     return {
         "x": cx,
         "y": cy,
@@ -212,10 +221,21 @@ def build_pitch_roi_mask(
     return mask
 
 
-def _detect_contours(binary: np.ndarray, roi_mask: np.ndarray | None) -> list[dict[str, Any]]:
+def _detect_contours(
+    binary: np.ndarray,
+    roi_mask: np.ndarray | None,
+    offset: tuple[int, int] = (0, 0),
+) -> list[dict[str, Any]]:
+    # ``binary`` is the caller's per-frame scratch mask: the ROI is applied in
+    # place rather than into a fresh frame-sized buffer.
     if roi_mask is not None:
-        binary = cv2.bitwise_and(binary, roi_mask)
-    contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE)
+        cv2.bitwise_and(binary, roi_mask, dst=binary)
+    # Most frames leave nothing in the mask; checking is far cheaper than an
+    # empty contour scan.
+    if not cv2.hasNonZero(binary):
+        return []
+    # ``offset`` shifts contours found in a cropped mask back to frame pixels.
+    contours, _ = cv2.findContours(binary, cv2.RETR_EXTERNAL, cv2.CHAIN_APPROX_SIMPLE, offset=offset)
     dets: list[dict[str, Any]] = []
     for c in contours:
         m = _contour_metrics(c)
@@ -254,28 +274,142 @@ def _detect_contours(binary: np.ndarray, roi_mask: np.ndarray | None) -> list[di
     return dets
 
 
+class _RoiWindow:
+    """The bounding box of an ROI mask plus a margin, cached per mask.
+
+    Detection is per-pixel up to its morphology, so a detector only needs
+    the pixels the mask keeps plus the reach of its open/close; on an
+    umpire-POV framing that box is about a third of the frame. With the
+    margin covering the morphology reach, the masked output is identical to
+    processing the whole frame.
+    """
+
+    def __init__(self, margin_px: int):
+        self._margin = margin_px
+        self._src: np.ndarray | None = None
+        self._shape: tuple[int, int] | None = None
+        self._window: tuple[slice, slice] | None = None
+        self.mask: np.ndarray | None = None  # ROI mask cropped to the window
+        self.offset: tuple[int, int] = (0, 0)  # (x, y) of the window in the frame
+
+    def update(self, frame_shape: tuple[int, ...], roi_mask: np.ndarray | None) -> bool:
+        """Re-derive the window if the mask or frame size changed; returns True if so."""
+        shape = (int(frame_shape[0]), int(frame_shape[1]))
+        if self._shape == shape and roi_mask is self._src:
+            return False
+        self._src, self._shape = roi_mask, shape
+        if roi_mask is None:
+            self._window, self.mask, self.offset = None, None, (0, 0)
+            return True
+        x, y, w, h = cv2.boundingRect(roi_mask)
+        m = self._margin
+        rows = slice(max(0, y - m), min(shape[0], y + h + m))
+        cols = slice(max(0, x - m), min(shape[1], x + w + m))
+        self._window = (rows, cols)
+        # A contiguous copy, made once per mask: the per-frame ROI AND runs
+        # faster on one dense block than on a strided view of the full mask.
+        self.mask = np.ascontiguousarray(roi_mask[rows, cols])
+        self.offset = (cols.start, rows.start)
+        return True
+
+    def crop(self, frame: np.ndarray) -> np.ndarray:
+        return frame if self._window is None else frame[self._window]
+
+
+def _ensure_buffer(buf: np.ndarray | None, shape: tuple[int, ...]) -> np.ndarray:
+    """Reuse ``buf`` for a uint8 image of ``shape`` or allocate a fresh one."""
+    if buf is None or buf.shape != shape:
+        return np.empty(shape, dtype=np.uint8)
+    return buf
+
+
+def _morph_pair(mask: np.ndarray, scratch: np.ndarray, kernel: np.ndarray, first: int, second: int) -> None:
+    """Apply morphology ``first`` then ``second`` to ``mask`` in place, via ``scratch``."""
+    cv2.morphologyEx(mask, first, kernel, dst=scratch)
+    cv2.morphologyEx(scratch, second, kernel, dst=mask)
+
+
 class MotionBallDetector:
-    """MOG2 background subtraction.  Picks up anything that moves."""
+    """MOG2 background subtraction.  Picks up anything that moves.
+
+    With an ROI mask only its window (see :class:`_RoiWindow`) is modelled:
+    MOG2 is per-pixel, so pixels the mask discards never need a background
+    model. The foreground and morphology buffers are reused across frames.
+    """
+
+    # Open then close with a 3x3 kernel: each output pixel depends on inputs
+    # up to 4 px away.
+    _CROP_MARGIN_PX = 4
 
     def __init__(self, threshold: int = 25):
-        self._bg = cv2.createBackgroundSubtractorMOG2(
+        self._threshold = float(threshold)
+        self._bg = self._new_model()
+        self._kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
+        self._roi = _RoiWindow(self._CROP_MARGIN_PX)
+        self._fg: np.ndarray | None = None
+        self._tmp: np.ndarray | None = None
+
+    def _new_model(self) -> cv2.BackgroundSubtractorMOG2:
+        return cv2.createBackgroundSubtractorMOG2(
             history=12,
-            varThreshold=float(threshold),
+            varThreshold=self._threshold,
             detectShadows=False,
         )
-        self._kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (3, 3))
 
     def detect(self, frame: np.ndarray, roi_mask: np.ndarray | None = None) -> list[dict[str, Any]]:
-        fg = self._bg.apply(frame)
-        fg = cv2.morphologyEx(fg, cv2.MORPH_OPEN, self._kernel)
-        fg = cv2.morphologyEx(fg, cv2.MORPH_CLOSE, self._kernel)
-        return _detect_contours(fg, roi_mask)
+        if self._roi.update(frame.shape, roi_mask):
+            # A different region means a different pixel grid for the model.
+            self._bg = self._new_model()
+        frame = self._roi.crop(frame)
+        self._fg = _ensure_buffer(self._fg, frame.shape[:2])
+        self._tmp = _ensure_buffer(self._tmp, frame.shape[:2])
+        self._bg.apply(frame, fgmask=self._fg)
+        _morph_pair(self._fg, self._tmp, self._kernel, cv2.MORPH_OPEN, cv2.MORPH_CLOSE)
+        return _detect_contours(self._fg, self._roi.mask, self._roi.offset)
+
+
+class SharedHsvFrame:
+    """One BGR->HSV conversion per frame, shared by several colour detectors.
+
+    The colour seeds of an "auto" run threshold the same ROI window of the
+    same frames, so each converting it is the same ~1 ms pass repeated. The
+    returned image is shared: callers only read it, and it is overwritten
+    only by the next frame.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._frame: np.ndarray | None = None
+        self._key: tuple | None = None
+        self._hsv: np.ndarray | None = None
+
+    def convert(self, frame: np.ndarray, roi: _RoiWindow) -> np.ndarray:
+        crop = roi.crop(frame)
+        key = (roi.offset, crop.shape)
+        with self._lock:
+            # Holding the last frame keeps the identity check sound (see
+            # :class:`SharedMotionDetector`).
+            if frame is not self._frame or key != self._key:
+                self._hsv = _ensure_buffer(self._hsv, crop.shape)
+                cv2.cvtColor(crop, cv2.COLOR_BGR2HSV, dst=self._hsv)
+                self._frame, self._key = frame, key
+            return self._hsv
 
 
 class ColorBallDetector:
-    """HSV-thresholded color ball detector."""
+    """HSV-thresholded color ball detector.
+
+    Works on the ROI window only (see :class:`_RoiWindow`) and writes the
+    HSV image and masks into buffers reused across frames. Pass a
+    :class:`SharedHsvFrame` as ``hsv`` when several colour detectors consume
+    the same frames.
+    """
+
+    # Close then open with a 5x5 kernel: each output pixel depends on inputs
+    # up to 8 px away.
+    _CROP_MARGIN_PX = 8
 
-    def __init__(self, ball_color: str = "red"):
+    def __init__(self, ball_color: str = "red", *, hsv: SharedHsvFrame | None = None):
         self.ball_color = ball_color
         if ball_color == "red":
             # Tighter than before: bright cricket-ball crimson, not skin/lips/wood.
@@ -290,33 +424,120 @@ class ColorBallDetector:
             ]
         else:  # white
             self.ranges = [((0, 0, 210), (180, 35, 255))]
+        self._bounds = [
+            (np.array(lo, dtype=np.uint8), np.array(hi, dtype=np.uint8)) for lo, hi in self.ranges
+        ]
         self._kernel = cv2.getStructuringElement(cv2.MORPH_ELLIPSE, (5, 5))
+        self._roi = _RoiWindow(self._CROP_MARGIN_PX)
+        self._shared_hsv = hsv
+        self._hsv: np.ndarray | None = None
+        self._mask: np.ndarray | None = None
+        self._part: np.ndarray | None = None
 
     def detect(self, frame: np.ndarray, roi_mask: np.ndarray | None = None) -> list[dict[str, Any]]:
-        hsv = cv2.cvtColor(frame, cv2.COLOR_BGR2HSV)
-        mask: np.ndarray | None = None
-        for lo, hi in self.ranges:
-            m = cv2.inRange(hsv, np.array(lo), np.array(hi))
-            mask = m if mask is None else cv2.bitwise_or(mask, m)
-        if mask is None:
+        if not self._bounds:
             return []
-        mask = cv2.morphologyEx(mask, cv2.MORPH_CLOSE, self._kernel)
-        mask = cv2.morphologyEx(mask, cv2.MORPH_OPEN, self._kernel)
-        return _detect_contours(mask, roi_mask)
+        self._roi.update(frame.shape, roi_mask)
+        if self._shared_hsv is not None:
+            hsv = self._shared_hsv.convert(frame, self._roi)
+        else:
+            frame = self._roi.crop(frame)
+            self._hsv = hsv = _ensure_buffer(self._hsv, frame.shape)
+            cv2.cvtColor(frame, cv2.COLOR_BGR2HSV, dst=hsv)
+        self._mask = _ensure_buffer(self._mask, hsv.shape[:2])
+        self._part = _ensure_buffer(self._part, hsv.shape[:2])
+        mask, part = self._mask, self._part
+        # Wrapping hues (red, pink) stay as separate inRange passes: a
+        # rotated-hue single pass either needs an extra LUT pass (slower) or
+        # converts via swapped channels, which rounds differently at band edges.
+        (lo, hi), *rest = self._bounds
+        cv2.inRange(hsv, lo, hi, dst=mask)
+        for lo, hi in rest:
+            cv2.inRange(hsv, lo, hi, dst=part)
+            cv2.bitwise_or(mask, part, dst=mask)
+        _morph_pair(mask, part, self._kernel, cv2.MORPH_CLOSE, cv2.MORPH_OPEN)
+        return _detect_contours(mask, self._roi.mask, self._roi.offset)
+
+
+class SharedMotionDetector:
+    """One :class:`MotionBallDetector` serving several combined detectors.
+
+    The colour seeds of an "auto" run see the same frames under the same ROI,
+    so their motion halves are identical; this runs the background model once
+    per frame and hands each caller its own copy of the candidates. Callers
+    may run concurrently on a frame; the first computes, the rest reuse.
+    """
+
+    def __init__(self) -> None:
+        self._motion = MotionBallDetector()
+        self._lock = threading.Lock()
+        self._frame: np.ndarray | None = None
+        self._roi_mask: np.ndarray | None = None
+        self._dets: list[dict[str, Any]] = []
+
+    def detect(self, frame: np.ndarray, roi_mask: np.ndarray | None = None) -> list[dict[str, Any]]:
+        with self._lock:
+            # Holding the last frame keeps the identity check sound: the array
+            # cannot be freed and its id reused while it is cached here.
+            if frame is not self._frame or roi_mask is not self._roi_mask:
+                self._dets = self._motion.detect(frame, roi_mask)
+                self._frame, self._roi_mask = frame, roi_mask
+            return [dict(d) for d in self._dets]
+
+
+# Runs the colour half of combined detectors alongside their motion half.
+# Both are OpenCV calls that release the GIL; on a single CPU there is
+# nothing to overlap, so the halves run back to back. Created on first use
+# and kept small: detectors are already spread across the per-pass detect
+# pool, so this only needs to cover the colour half of a couple at once.
+COLOR_POOL_WORKERS = 2
+_color_pool_lock = threading.Lock()
+_color_pool_executor: ThreadPoolExecutor | None = None
+
+
+def _color_pool() -> ThreadPoolExecutor | None:
+    global _color_pool_executor
+    if (os.cpu_count() or 1) <= 1:
+        return None
+    with _color_pool_lock:
+        if _color_pool_executor is None:
+            _color_pool_executor = ThreadPoolExecutor(
+                max_workers=COLOR_POOL_WORKERS, thread_name_prefix="color"
+            )
+        return _color_pool_executor
 
 
 class CombinedBallDetector:
-    """Fuse motion + color.  A blob seen by both is the strongest ball candidate."""
+    """Fuse motion + color.  A blob seen by both is the strongest ball candidate.
+
+    Pass a :class:`SharedMotionDetector` as ``motion`` and a
+    :class:`SharedHsvFrame` as ``hsv`` when several combined detectors
+    consume the same frames.
+    """
 
     _MERGE_DIST_PX = 25.0
 
-    def __init__(self, ball_color: str = "red"):
-        self.motion = MotionBallDetector()
-        self.color = ColorBallDetector(ball_color)
+    def __init__(
+        self,
+        ball_color: str = "red",
+        *,
+        motion: MotionBallDetector | SharedMotionDetector | None = None,
+        hsv: SharedHsvFrame | None = None,
+    ):
+        self.motion = motion if motion is not None else MotionBallDetector()
+        self.color = ColorBallDetector(ball_color, hsv=hsv)
 
     def detect(self, frame: np.ndarray, roi_mask: np.ndarray | None = None) -> list[dict[str, Any]]:
-        motion_dets = self.motion.detect(frame, roi_mask)
-        color_dets = self.color.detect(frame, roi_mask)
+        # The motion model carries state across frames, so frames stay in
+        # order; within a frame the colour pass is independent of it.
+        pool = _color_pool()
+        if pool is None:
+            motion_dets = self.motion.detect(frame, roi_mask)
+            color_dets = self.color.detect(frame, roi_mask)
+        else:
+            color_fut = pool.submit(self.color.detect, frame, roi_mask)
+            motion_dets = self.motion.detect(frame, roi_mask)
+            color_dets = color_fut.result()
 
         merged: list[dict[str, Any]] = []
         used_color: set[int] = set()
@@ -361,6 +582,24 @@ class CombinedBallDetector:
         return merged
 
 
+# Loaded YOLO models by weights path, per thread. Loading the weights costs
+# seconds, so a job worker keeps its model for later jobs; Ultralytics models
+# are not safe to share between concurrent predictions, hence one per thread.
+_yolo_models = threading.local()
+
+
+def _load_yolo(weights_path: str):
+    cache: dict[str, Any] | None = getattr(_yolo_models, "by_path", None)
+    if cache is None:
+        cache = _yolo_models.by_path = {}
+    model = cache.get(weights_path)
+    if model is None:
+        from ultralytics import YOLO  # local import keeps ML deps optional
+
+        model = cache[weights_path] = YOLO(weights_path)
+    return model
+
+
 class YoloBallDetector:
     """Learned ball detector (Ultralytics YOLO) for cluttered real footage.
 
@@ -378,17 +617,16 @@ class YoloBallDetector:
     """
 
     def __init__(self, weights_path: str, *, conf: float = 0.2, imgsz: int = 1280):
-        from ultralytics import YOLO  # local import keeps ML deps optional
-
-        self._model = YOLO(weights_path)
+        self._model = _load_yolo(weights_path)
         self._conf = conf
         self._imgsz = imgsz
 
     def detect(self, frame: np.ndarray, roi_mask: np.ndarray | None = None) -> list[dict[str, Any]]:
         res = self._model.predict(frame, imgsz=self._imgsz, conf=self._conf, verbose=False)[0]
+        # One host transfer for all boxes, not a device read per coordinate.
+        boxes = res.boxes.cpu().numpy()
         dets: list[dict[str, Any]] = []
-        for box in res.boxes:
-            x1, y1, x2, y2 = (float(v) for v in box.xyxy[0])
+        for (x1, y1, x2, y2), conf in zip(boxes.xyxy.tolist(), boxes.conf.tolist()):
             w, h = x2 - x1, y2 - y1
             dets.append({
                 "x": (x1 + x2) / 2.0,
@@ -398,7 +636,7 @@ class YoloBallDetector:
                 "circularity": 1.0,
                 "is_streak": 0.0,
                 "streak_len": 0.0,
-                "confidence": float(box.conf[0]),
+                "confidence": conf,
                 "source": "yolo",
             })
         dets.sort(key=lambda d: d["confidence"], reverse=True)
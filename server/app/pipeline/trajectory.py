@@ -45,17 +45,38 @@ class TrajectoryFit:
     notes: list[str]
 
 
-def _propagate(
-    *,
-    x0: float,
-    y0: float,
-    vx: float,           # px / ms
-    vy: float,           # px / ms
-    ay: float,           # px / ms^2 (downward, positive = falling)
-    dt: float,           # ms
-) -> tuple[float, float]:
-    """Constant-acceleration image-space propagation."""
-    return (x0 + vx * dt, y0 + vy * dt + 0.5 * ay * dt * dt)
+def _fit_image_motion(
+    ts: np.ndarray, xs: np.ndarray, ys: np.ndarray, ws: np.ndarray,
+) -> tuple[float, float, float, float, float]:
+    """Weighted LSQ of x(t) = x0 + vx*t and y(t) = y0 + vy*t + 0.5*ay*t^2.
+
+    Returns ``(x0, vx, y0, vy, ay)``. The quadratic is ``np.polyfit(ts, ys, 2,
+    w=ws)`` — the same weighted, column-scaled Vandermonde handed to the same
+    solver, without polyfit's wrapper. The line's 2x2 normal equations are
+    solved in closed form about the weighted mean time, which keeps them well
+    conditioned; raises ``LinAlgError`` when all samples share one time.
+    """
+    w2 = ws * ws
+    sw = float(w2.sum())
+    t_mean = float(w2 @ ts) / sw
+    x_mean = float(w2 @ xs) / sw
+    tc = ts - t_mean
+    stt = float(w2 @ (tc * tc))
+    if stt <= 0.0:
+        raise np.linalg.LinAlgError("degenerate time base")
+    vx = float(w2 @ (tc * (xs - x_mean))) / stt
+    x0 = x_mean - vx * t_mean
+
+    lhs = np.empty((ts.shape[0], 3), dtype=float)
+    lhs[:, 0] = ts * ts
+    lhs[:, 1] = ts
+    lhs[:, 2] = 1.0
+    lhs *= ws[:, None]
+    scale = np.sqrt((lhs * lhs).sum(axis=0))
+    lhs /= scale
+    rcond = ts.shape[0] * np.finfo(float).eps
+    cy = np.linalg.lstsq(lhs, ys * ws, rcond)[0] / scale
+    return x0, vx, float(cy[2]), float(cy[1]), 2.0 * float(cy[0])
 
 
 def _frames_in_order(
@@ -88,10 +109,19 @@ def _suppress_static_clutter(
     radius = max(12.0, 0.012 * image_diagonal_px)  # ~26 px on 1080p
     r2 = radius * radius
 
-    # Per-frame representative points (use every detection).
-    pts_per_frame: list[list[tuple[float, float]]] = [
-        [(float(d["x"]), float(d["y"])) for d in dets] for _, dets in frames
-    ]
+    # Every detection as one row; frames own contiguous runs of rows. Single
+    # precision is ample for a ~26 px radius test on pixel coordinates and
+    # halves the cost of the distance blocks below.
+    counts = np.array([len(dets) for _, dets in frames], dtype=np.intp)
+    if not counts.any():
+        return frames
+    xy = np.array(
+        [(float(d["x"]), float(d["y"])) for _, dets in frames for d in dets], dtype=np.float32
+    )
+    frame_of = np.repeat(np.arange(n_frames), counts)
+    occupied = np.flatnonzero(counts)
+    starts = (np.cumsum(counts) - counts)[occupied]
+    n_occupied = occupied.size
 
     # A truly static object (net post, cone) leaves near-neighbour hits spread
     # across the WHOLE clip — from the first frames to the last. A genuinely
@@ -100,33 +130,29 @@ def _suppress_static_clutter(
     # so its hits stay temporally clustered even when numerous. Gate suppression
     # on temporal SPAN, not merely count, so a slow early track is not deleted.
     span_frac = 0.60
+    static = np.zeros(xy.shape[0], dtype=bool)
+    # Rows in blocks bound the (block, all detections) distance matrix.
+    block = 256
+    for b0 in range(0, xy.shape[0], block):
+        rows = xy[b0:b0 + block]
+        d2 = (xy[None, :, 0] - rows[:, None, 0]) ** 2 + (xy[None, :, 1] - rows[:, None, 1]) ** 2
+        # Which other frames hold a detection within the radius.
+        hit = np.logical_or.reduceat(d2 <= r2, starts, axis=1)
+        own = np.searchsorted(occupied, frame_of[b0:b0 + block])
+        hit[np.arange(rows.shape[0]), own] = False
+        occ = hit.sum(axis=1)
+        first_hit = occupied[hit.argmax(axis=1)]
+        last_hit = occupied[n_occupied - 1 - hit[:, ::-1].argmax(axis=1)]
+        # first_hit/last_hit bound the frame range over which the
+        # neighbourhood stayed occupied.
+        span = np.where(occ > 0, last_hit - first_hit + 1, 0)
+        static[b0:b0 + block] = (occ > occupancy_frac * n_frames) & (span >= span_frac * n_frames)
+
     cleaned: list[tuple[int, list[dict]]] = []
-    for fi, (t_ms, dets) in enumerate(frames):
-        kept: list[dict] = []
-        for d in dets:
-            dx0, dy0 = float(d["x"]), float(d["y"])
-            occ = 0
-            first_hit: int | None = None
-            last_hit = 0
-            for fj in range(n_frames):
-                if fj == fi:
-                    continue
-                for (px, py) in pts_per_frame[fj]:
-                    if (px - dx0) ** 2 + (py - dy0) ** 2 <= r2:
-                        occ += 1
-                        if first_hit is None:
-                            first_hit = fj
-                        last_hit = fj
-                        break
-            # fj is iterated in ascending order, so first_hit/last_hit bound the
-            # frame range over which the neighbourhood stayed occupied.
-            span = 0 if first_hit is None else (last_hit - first_hit + 1)
-            is_static = (
-                occ > occupancy_frac * n_frames and span >= span_frac * n_frames
-            )
-            if not is_static:
-                kept.append(d)
-        cleaned.append((t_ms, kept))
+    i = 0
+    for t_ms, dets in frames:
+        cleaned.append((t_ms, [d for k, d in enumerate(dets) if not static[i + k]]))
+        i += len(dets)
     return cleaned
 
 
@@ -150,6 +176,36 @@ def _search_best_arc(
     """
     exclude = exclude or set()
     n_frames = len(candidates)
+    r2 = search_radius_px * search_radius_px
+    min_disp_px = max(2.0, 0.002 * image_diagonal_px)  # ~4 px on 1080p
+
+    # Normalise every detection to an (x, y, confidence) tuple once. The
+    # hypothesis loop below runs frames x detections times per seed, so it
+    # must not pay for dict lookups and float coercion on every visit. `live`
+    # additionally drops the claimed detections (keeping their original
+    # index), which takes the `exclude` membership test out of that loop too.
+    norm: list[list[tuple[float, float, float]]] = [
+        [(float(d["x"]), float(d["y"]), float(d.get("confidence", 0.0))) for d in dets]
+        for dets in candidates
+    ]
+    live: list[list[tuple[int, float, float, float]]] = [
+        [(di, x, y, c) for di, (x, y, c) in enumerate(dets) if (k, di) not in exclude]
+        for k, dets in enumerate(norm)
+    ]
+    # The same live detections flattened into frame-ordered columns, so each
+    # hypothesis scores every later detection in one vectorised pass and
+    # gathers its inliers by index. `first_at[i]` is the first flat entry at
+    # frame >= i.
+    flat = [(k, di, x, y, c) for k, dets in enumerate(live) for (di, x, y, c) in dets]
+    flat_arr = np.array(flat, dtype=float).reshape(-1, 5)
+    flat_k = flat_arr[:, 0].astype(np.intp)
+    flat_di = flat_arr[:, 1].astype(np.intp)
+    flat_x = flat_arr[:, 2]
+    flat_y = flat_arr[:, 3]
+    flat_w = np.clip(flat_arr[:, 4], 0.1, 1.0)
+    times_f = np.asarray(times, dtype=float)
+    flat_t = times_f[flat_k]
+    first_at = np.searchsorted(flat_k, np.arange(n_frames))
 
     # Seed hypotheses from detection pairs across the WHOLE clip. A delivery can
     # be released anywhere in the (often untrimmed) segment, so we pair every
@@ -172,16 +228,18 @@ def _search_best_arc(
     if not seed_pairs:
         return None, set()
 
-    best_fit: TrajectoryFit | None = None
-    best_keys: set[tuple[int, int]] = set()
+    # (flat inlier indices, resid, rms, vx, vy, g_seed, ay) of the best
+    # hypothesis so far.
+    best: tuple | None = None
 
     # Image-space gravity seeds for a phone-held camera; the LSQ refinement
     # adjusts the exact value. Zero covers near-axis (umpire-POV) motion.
     g_seed_options = [0.0, 5e-4, 2e-3]
 
+    cur_i = -1
     for (i, ai, j, bj) in seed_pairs:
-        x0, y0 = candidates[i][ai]["x"], candidates[i][ai]["y"]
-        x1, y1 = candidates[j][bj]["x"], candidates[j][bj]["y"]
+        x0, y0, _ = norm[i][ai]
+        x1, y1, _ = norm[j][bj]
         dt_ij = float(times[j] - times[i])
         if dt_ij <= 0:
             continue
@@ -190,52 +248,60 @@ def _search_best_arc(
 
         # Reject seeds whose displacement is too small to be the ball.
         disp_px = ((x1 - x0) ** 2 + (y1 - y0) ** 2) ** 0.5
-        min_disp_px = max(2.0, 0.002 * image_diagonal_px)  # ~4 px on 1080p
         if disp_px < min_disp_px:
             continue
 
-        for g_seed in g_seed_options:
-            inliers: list[tuple[int, int]] = []  # (frame_idx, det_idx)
-            sq_err_sum = 0.0
-            for k in range(i, n_frames):
-                dt_k = float(times[k] - times[i])
-                px, py = _propagate(x0=x0, y0=y0, vx=vx, vy=vy, ay=g_seed, dt=dt_k)
-                # Pick the closest in-frame detection if any is within radius.
-                best_d = None
-                best_d2 = search_radius_px * search_radius_px
-                best_idx = -1
-                for di, d in enumerate(candidates[k]):
-                    if (k, di) in exclude:
-                        continue
-                    dx = d["x"] - px
-                    dy = d["y"] - py
-                    d2 = dx * dx + dy * dy
-                    if d2 < best_d2:
-                        best_d2 = d2
-                        best_d = d
-                        best_idx = di
-                if best_d is not None:
-                    inliers.append((k, best_idx))
-                    sq_err_sum += best_d2
-
-            if len(inliers) < min_inliers:
+        # Every live detection from frame i on, with its time since the seed
+        # and the gravity drop over that time under each g seed. Seed pairs
+        # arrive grouped by frame i, so these are built once per seed frame.
+        if i != cur_i:
+            cur_i = i
+            s0 = first_at[i]
+            kk = flat_k[s0:]
+            dts = flat_t[s0:] - times_f[i]
+            xs_fwd = flat_x[s0:]
+            ys_fwd = flat_y[s0:]
+            drops = [0.5 * g * dts * dts for g in g_seed_options]
+
+        # Constant-acceleration propagation: x is linear in time and shared
+        # by all g seeds; y adds the seed's drop.
+        dx = xs_fwd - (x0 + vx * dts)
+        dx2 = dx * dx
+        y_lin = y0 + vy * dts
+        for g_seed, drop in zip(g_seed_options, drops):
+            dy = ys_fwd - (y_lin + drop)
+            d2 = dx2 + dy * dy
+            hit = np.flatnonzero(d2 < r2)
+            # At most one inlier per frame, so too few hits can never pass.
+            if hit.size < min_inliers:
                 continue
-            rms = (sq_err_sum / len(inliers)) ** 0.5
+            # Per frame, take the closest detection within the radius (the
+            # first one on a tie): sort hits by (frame, d2) — lexsort is
+            # stable — and keep the head of each frame's run.
+            hk = kk[hit]
+            order = np.lexsort((d2[hit], hk))
+            hk_sorted = hk[order]
+            head = np.ones(hk_sorted.size, dtype=bool)
+            head[1:] = hk_sorted[1:] != hk_sorted[:-1]
+            sel = s0 + hit[order[head]]  # flat index per inlier, frame order
+            if sel.size < min_inliers:
+                continue
+            # Summed in frame order, exactly as a per-frame accumulation.
+            sq_err_sum = sum(d2[sel - s0].tolist())
+            rms = (sq_err_sum / sel.size) ** 0.5
 
-            # Refine via weighted LSQ on the inlier set.
-            ts = np.array([times[k] - times[i] for (k, _) in inliers], dtype=float)
-            xs = np.array([candidates[k][di]["x"] for (k, di) in inliers], dtype=float)
-            ys = np.array([candidates[k][di]["y"] for (k, di) in inliers], dtype=float)
-            ws = np.array([candidates[k][di]["confidence"] for (k, di) in inliers], dtype=float)
-            ws = np.clip(ws, 0.1, 1.0)
+            # Refine via weighted LSQ on the inlier set, gathered straight
+            # from the flat columns.
+            ts = dts[sel - s0]
+            xs = flat_x[sel]
+            ys = flat_y[sel]
+            ws = flat_w[sel]
 
             # x(t) = x0 + vx * t   (linear)
             # y(t) = y0 + vy * t + 0.5 * ay * t^2  (quadratic)
             try:
-                vx_fit, x0_fit = np.polyfit(ts, xs, 1, w=ws)
-                ay_half, vy_fit, y0_fit = np.polyfit(ts, ys, 2, w=ws)
-                ay_fit = 2.0 * ay_half
-            except Exception:
+                x0_fit, vx_fit, y0_fit, vy_fit, ay_fit = _fit_image_motion(ts, xs, ys, ws)
+            except np.linalg.LinAlgError:
                 continue
 
             # Recompute residuals after refinement.
@@ -248,37 +314,40 @@ def _search_best_arc(
             if rms_refined > rms * 1.5:
                 continue
 
-            # Build trajectory points.
-            traj_pts: list[TrajectoryPoint] = []
-            for (k, di) in inliers:
-                d = candidates[k][di]
-                # Confidence: detector conf * fit-tightness.
-                tightness = max(0.1, 1.0 - (resid[inliers.index((k, di))] / search_radius_px))
-                conf = float(min(1.0, 0.4 * d["confidence"] + 0.6 * tightness))
-                traj_pts.append(TrajectoryPoint(
-                    t_ms=int(times[k]),
-                    x_px=float(d["x"]),
-                    y_px=float(d["y"]),
-                    radius_px=float(d.get("radius_px", 0.0)),
-                    confidence=conf,
-                ))
-
-            fit = TrajectoryFit(
-                points=traj_pts,
-                inliers=len(inliers),
-                candidates_total=total_candidates,
-                rms_px=rms_refined,
-                px_per_ms_x=float(vx_fit),
-                px_per_ms_y=float(vy_fit),
-                notes=[f"seed_g={g_seed:.1f}", f"refined ay={ay_fit:.3f}"],
-            )
-
-            # Score: prefer more inliers, then tighter fit.
-            if best_fit is None or (fit.inliers, -fit.rms_px) > (best_fit.inliers, -best_fit.rms_px):
-                best_fit = fit
-                best_keys = set(inliers)
-
-    return best_fit, best_keys
+            # Score: prefer more inliers, then tighter fit. Points are only
+            # built for the winner, not for every hypothesis tried.
+            if best is None or (sel.size, -rms_refined) > (best[0].size, -best[2]):
+                best = (sel, resid, rms_refined, float(vx_fit), float(vy_fit), g_seed, ay_fit)
+
+    if best is None:
+        return None, set()
+    sel, resid, rms_refined, vx_fit, vy_fit, g_seed, ay_fit = best
+    inliers: list[tuple[int, int]] = list(  # (frame_idx, det_idx)
+        zip(flat_k[sel].tolist(), flat_di[sel].tolist())
+    )
+    traj_pts: list[TrajectoryPoint] = []
+    for n_in, (k, di) in enumerate(inliers):
+        x, y, c = norm[k][di]
+        # Confidence: detector conf * fit-tightness.
+        tightness = max(0.1, 1.0 - (resid[n_in] / search_radius_px))
+        conf = float(min(1.0, 0.4 * c + 0.6 * tightness))
+        traj_pts.append(TrajectoryPoint(
+            t_ms=int(times[k]),
+            x_px=x,
+            y_px=y,
+            radius_px=float(candidates[k][di].get("radius_px", 0.0)),
+            confidence=conf,
+        ))
+    best_fit = TrajectoryFit(
+        points=traj_pts,
+        inliers=len(inliers),
+        candidates_total=total_candidates,
+        rms_px=rms_refined,
+        px_per_ms_x=vx_fit,
+        px_per_ms_y=vy_fit,
+        notes=[f"seed_g={g_seed:.1f}", f"refined ay={ay_fit:.3f}"],
+    )
+    return best_fit, set(inliers)
 
 
 def _merge_bounce_arcs(
@@ -387,6 +456,11 @@ def _extend_track(
 
     n_frames = len(candidates)
     idx_of_t = {t: i for i, t in enumerate(times)}
+    r2 = search_radius_px * search_radius_px
+    # (x, y, detection) per frame, coerced once rather than on every probe.
+    norm: list[list[tuple[float, float, dict]]] = [
+        [(float(d["x"]), float(d["y"]), d) for d in dets] for dets in candidates
+    ]
 
     def local_predict(end_pts: list[TrajectoryPoint], t_ms: int) -> tuple[float, float]:
         t0 = end_pts[0].t_ms
@@ -397,9 +471,9 @@ def _extend_track(
         return float(np.polyval(cu, t_ms - t0)), float(np.polyval(cv, t_ms - t0))
 
     def nearest(fi: int, pu: float, pv: float) -> dict | None:
-        best, best_d2 = None, search_radius_px * search_radius_px
-        for d in candidates[fi]:
-            d2 = (d["x"] - pu) ** 2 + (d["y"] - pv) ** 2
+        best, best_d2 = None, r2
+        for x, y, d in norm[fi]:
+            d2 = (x - pu) ** 2 + (y - pv) ** 2
             if d2 < best_d2:
                 best_d2, best = d2, d
         return best
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import queue
+import threading
 from dataclasses import dataclass
+from typing import Iterable, Iterator
 
 import cv2
 import numpy as np
@@ -17,6 +20,9 @@ class VideoDecodeError(RuntimeError):
     pass
 
 
+_END = object()  # end-of-stream marker on the prefetch queue
+
+
 class VideoReader:
     """Frame-aligned video reader that survives phone-recorded HEVC.
 
@@ -35,8 +41,15 @@ class VideoReader:
     # scan after a seek, so a stuck/mislabelled stream can never loop forever.
     _MAX_SEEK_SCAN = 300
 
-    def __init__(self, video_path: str):
-        self._cap = cv2.VideoCapture(video_path)
+    def __init__(self, video_path: str, *, thread_count: int | None = None):
+        # ``thread_count`` sizes FFmpeg's decoder thread pool. It can only be
+        # set as an open-time parameter; None keeps OpenCV's default.
+        if thread_count is not None and hasattr(cv2, "CAP_PROP_N_THREADS"):
+            self._cap = cv2.VideoCapture(
+                video_path, cv2.CAP_ANY, [cv2.CAP_PROP_N_THREADS, max(1, int(thread_count))]
+            )
+        else:
+            self._cap = cv2.VideoCapture(video_path)
         if not self._cap.isOpened():
             raise VideoDecodeError("Could not open video")
 
@@ -53,12 +66,16 @@ class VideoReader:
         self._last_frame: np.ndarray | None = None
         self._cursor_idx: int = -1  # next read returns frame index cursor+1
         self._consecutive_stale = 0
+        self._prefetch: tuple[threading.Event, threading.Thread] | None = None
 
     @property
     def meta(self) -> VideoMeta:
         return self._meta
 
     def close(self) -> None:
+        # A prefetching iterator abandoned mid-stream (the caller raised)
+        # still owns a decode thread; it must be off the capture first.
+        self._stop_prefetch()
         try:
             self._cap.release()
         except Exception:
@@ -101,8 +118,21 @@ class VideoReader:
         while self._cursor_idx < target_idx:
             if reads >= budget:
                 break  # give up cleanly; return the best frame decoded so far
-            ok, raw = self._cap.read()
+            # Frames short of the target (sampling below the video's frame
+            # rate, or the run-up from a keyframe) are only grabbed: the codec
+            # still decodes them, but the BGR conversion is skipped.
+            ok = self._cap.grab()
             reads += 1
+            raw = None
+            if ok:
+                # Trust the container's real frame index rather than a virtual
+                # +1, so a keyframe landing or a dropped frame can't drift the
+                # labelling. Fall back to +1 only if POS_FRAMES is unavailable.
+                pos = int(self._cap.get(cv2.CAP_PROP_POS_FRAMES))
+                self._cursor_idx = (pos - 1) if pos > 0 else (self._cursor_idx + 1)
+                if self._cursor_idx < target_idx and reads < budget:
+                    continue
+                ok, raw = self._cap.retrieve()
             if not ok or raw is None:
                 if self._last_frame is None:
                     raise VideoDecodeError(f"Failed to decode frame at {t_ms}ms")
@@ -120,11 +150,6 @@ class VideoReader:
                 if pos > 0:
                     self._cursor_idx = pos - 1
                 return self._last_frame.copy()
-            # Trust the container's real frame index rather than a virtual +1,
-            # so a keyframe landing or a dropped frame can't drift the
-            # labelling. Fall back to +1 only if POS_FRAMES is unavailable.
-            pos = int(self._cap.get(cv2.CAP_PROP_POS_FRAMES))
-            self._cursor_idx = (pos - 1) if pos > 0 else (self._cursor_idx + 1)
             frame = raw
 
         if frame is None:
@@ -137,6 +162,66 @@ class VideoReader:
         self._last_frame = frame
         return frame
 
+    def iter_sampled(
+        self, times_ms: Iterable[int], *, prefetch: int = 0,
+    ) -> Iterator[tuple[int, np.ndarray]]:
+        """Yield ``(t_ms, frame)`` for each requested time, decoding lazily.
+
+        A caller that processes and drops each frame never holds more than
+        one decoded frame, however long the segment. With ``prefetch > 0`` a
+        background thread decodes up to that many frames ahead, overlapping
+        decode with the caller's per-frame work; the reader must not be used
+        for anything else until the iterator is exhausted or closed.
+        """
+        if prefetch <= 0:
+            for t_ms in times_ms:
+                yield t_ms, self.frame_at_ms(t_ms)
+            return
+
+        q: queue.Queue = queue.Queue(maxsize=prefetch)
+        stop = threading.Event()
+
+        def put(item: object) -> bool:
+            while not stop.is_set():
+                try:
+                    q.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for t_ms in times_ms:
+                    if not put((t_ms, self.frame_at_ms(t_ms))):
+                        return
+            except BaseException as e:  # noqa: BLE001 — re-raised in the consumer
+                put(e)
+                return
+            put(_END)
+
+        worker = threading.Thread(target=produce, name="video-decode", daemon=True)
+        self._prefetch = (stop, worker)
+        worker.start()
+        try:
+            while True:
+                item = q.get()
+                if item is _END:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item  # type: ignore[misc]
+        finally:
+            self._stop_prefetch()
+
+    def _stop_prefetch(self) -> None:
+        if self._prefetch is None:
+            return
+        stop, worker = self._prefetch
+        self._prefetch = None
+        stop.set()
+        worker.join()
+
     def _read_nonseek_fallback(self, t_ms: int) -> np.ndarray:
         ok, frame = self._cap.read()
         if not ok or frame is None:
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _server_dirs(tmp_path_factory):
+    # Importing app.main configures logging and creates its job store, and
+    # every job writes a central log; keep all of it out of the repo's
+    # logs/ and data/. Test modules import app.main lazily so this runs first.
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("POCKET_DRS_LOG_ROOT", str(tmp_path_factory.mktemp("logs")))
+        mp.setenv("POCKET_DRS_DATA_DIR", str(tmp_path_factory.mktemp("data")))
+        yield
+
+
+@pytest.fixture(scope="session")
+def client(_server_dirs):
+    # One app import and one TestClient for the whole session: the import pulls
+    # in OpenCV, NumPy and the pipeline modules, which dominates test wall time.
+    from fastapi.testclient import TestClient
+
+    import app.main
+
+    # Not used as a context manager: the startup hook requires Firebase.
+    yield TestClient(app.main.app)
+
+
+@pytest.fixture
+def job_store(client, tmp_path, monkeypatch):
+    """A fresh job store under ``tmp_path``, swapped in for the app's."""
+    import app.main
+    from app.jobs import JobStore
+
+    store = JobStore(data_dir=tmp_path / "data")
+    monkeypatch.setattr(app.main, "_store", store)
+    return store
+
+
+@pytest.fixture
+def fake_auth(client, monkeypatch):
+    """Accept any bearer token as user ``test-user`` and keep Firestore out."""
+    import app.main
+
+    def _no_firestore():
+        raise RuntimeError("Firestore is disabled in tests")
+
+    monkeypatch.setattr(app.main, "verify_user_token", lambda token: "test-user")
+    monkeypatch.setattr(app.main, "get_firestore", _no_firestore)
+    return {"Authorization": "Bearer test-token"}
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import functools
+
+import numpy as np
+import pytest
+
+from app.pipeline.reconstruction import (
+    DEFAULT_STUMP_HEIGHT_M,
+    STUMP_OUTER_HALF_M,
+    CameraPose,
+    _project_world,
+    _project_world_many,
+    solve_camera_pose_from_stumps,
+)
+
+
+# Exact taps for the synth_validate.py scene: portrait 1080x1920 phone 2.8 m
+# behind the striker's stumps, 1.7 m up, looking down a 20.12 m pitch.
+IMAGE_SIZE = (1080, 1920)
+H_FOV_DEG = 90.6
+PITCH_LENGTH_M = 20.12
+CAMERA_WORLD = (-2.8, 0.0, 1.7)
+
+STUMP_QUADS_PX = (
+    (496.62, 736.97), (583.38, 736.97), (582.25, 516.57), (497.75, 516.57),
+    (534.52, 1022.62), (545.48, 1022.62), (545.46, 993.17), (534.54, 993.17),
+)
+PITCH_CORNERS_PX = ((51.92, 516.57), (1028.08, 516.57), (603.07, 993.17), (476.93, 993.17))
+
+
+def _tapped_world_points() -> np.ndarray:
+    """World positions of STUMP_QUADS_PX then PITCH_CORNERS_PX, in tap order."""
+    half_w = 3.05 / 2.0
+    quad = [(-STUMP_OUTER_HALF_M, DEFAULT_STUMP_HEIGHT_M), (STUMP_OUTER_HALF_M, DEFAULT_STUMP_HEIGHT_M),
+            (STUMP_OUTER_HALF_M, 0.0), (-STUMP_OUTER_HALF_M, 0.0)]
+    stumps = [(x, y, z) for x in (0.0, PITCH_LENGTH_M) for (y, z) in quad]
+    corners = [(0.0, -half_w, 0.0), (0.0, half_w, 0.0),
+               (PITCH_LENGTH_M, half_w, 0.0), (PITCH_LENGTH_M, -half_w, 0.0)]
+    return np.array(stumps + corners, dtype=np.float64)
+
+
+@functools.lru_cache(maxsize=None)
+def _solve(with_corners: bool, known_length_m: float | None) -> tuple[CameraPose, float]:
+    # Each PnP length sweep is a few hundred solves; share them across tests.
+    return solve_camera_pose_from_stumps(
+        image_size=IMAGE_SIZE,
+        stump_quads_px=list(STUMP_QUADS_PX),
+        pitch_corners_px=list(PITCH_CORNERS_PX) if with_corners else None,
+        h_fov_deg=H_FOV_DEG,
+        known_length_m=known_length_m,
+    )
+
+
+@pytest.mark.parametrize(
+    ("with_corners", "known_length_m", "pose_note", "length_tol"),
+    [
+        (False, None, "stump-anchored pose", 0.05),
+        (True, None, "stump+corner pose", 0.05),
+        (True, PITCH_LENGTH_M, "stump+corner pose", 1e-9),
+    ],
+    ids=["stumps_only", "stumps_and_corners", "length_pinned"],
+)
+def test_pose_from_stumps(with_corners, known_length_m, pose_note, length_tol):
+    pose, length = _solve(with_corners, known_length_m)
+
+    assert pose.notes[0] == pose_note
+    assert length == pytest.approx(PITCH_LENGTH_M, abs=length_tol)
+    assert pose.reproj_error_px < 0.5
+    np.testing.assert_allclose(pose.cam_center_world.ravel(), CAMERA_WORLD, atol=0.01)
+
+
+def test_batch_projection_matches_taps_and_scalar_path():
+    pose, _ = _solve(True, PITCH_LENGTH_M)
+    world = _tapped_world_points()
+
+    uv, depth, ok = _project_world_many(pose, world)
+    assert ok.all()
+    np.testing.assert_allclose(uv, np.array(STUMP_QUADS_PX + PITCH_CORNERS_PX), atol=0.01)
+
+    # One point behind the camera exercises the depth cut-off in both paths.
+    world = np.vstack([world, (CAMERA_WORLD[0] - 1.0, 0.0, 1.0)])
+    uv, depth, ok = _project_world_many(pose, world)
+    for i, (x, y, z) in enumerate(world):
+        scalar = _project_world(pose, x, y, z)
+        if scalar is None:
+            assert not ok[i]
+            continue
+        assert ok[i]
+        np.testing.assert_allclose((uv[i, 0], uv[i, 1], depth[i]), scalar, rtol=0, atol=1e-9)
+    assert not ok[-1]
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import io
+import json
+
+import cv2
+import numpy as np
+import pytest
+
+
+W, H = 162, 288
+FPS = 30
+BALL_R = 3
+
+# Pitch taps for a portrait phone shot from behind the striker (the
+# synth_validate.py scene scaled down to W x H).
+CALIBRATION = {
+    "mode": "taps",
+    "h_fov_deg": 90.6,
+    "pitch_dimensions_m": {"length": 20.12, "width": 3.05},
+    "pitch_corners_px": [
+        {"x": 7.8, "y": 77.5},
+        {"x": 154.2, "y": 77.5},
+        {"x": 90.5, "y": 149.0},
+        {"x": 71.5, "y": 149.0},
+    ],
+    "stump_quads_px": [
+        {"x": 74.5, "y": 110.5},
+        {"x": 87.5, "y": 110.5},
+        {"x": 87.3, "y": 77.5},
+        {"x": 74.7, "y": 77.5},
+        {"x": 80.2, "y": 153.4},
+        {"x": 81.8, "y": 153.4},
+        {"x": 81.8, "y": 149.0},
+        {"x": 80.2, "y": 149.0},
+    ],
+}
+
+
+def _make_synthetic_frames(frames: int = 15) -> np.ndarray:
+    """A red ball dropping down the pitch on a flat green background."""
+    yy, xx = np.ogrid[-BALL_R : BALL_R + 1, -BALL_R : BALL_R + 1]
+    disc = (yy * yy + xx * xx) <= BALL_R * BALL_R
+    t = np.arange(frames) / (frames - 1)
+    xs = (81 + 4 * t).astype(int)
+    ys = (80 + 70 * t * t).astype(int)
+
+    vid = np.empty((frames, H, W, 3), np.uint8)
+    vid[:] = (60, 120, 60)
+    for i, (x, y) in enumerate(zip(xs, ys)):
+        vid[i, y - BALL_R : y + BALL_R + 1, x - BALL_R : x + BALL_R + 1][disc] = (0, 0, 255)
+    return vid
+
+
+def _write_clip(path, frames: np.ndarray) -> None:
+    # FFV1 is lossless: the pipeline decodes exactly the frames synthesised
+    # above, and encoding is far cheaper than a lossy mp4v pass.
+    vw = cv2.VideoWriter(str(path), cv2.VideoWriter_fourcc(*"FFV1"), FPS, (W, H))
+    for frame in frames:
+        vw.write(frame)
+    vw.release()
+
+
+@pytest.fixture(scope="session")
+def clip_bytes(tmp_path_factory) -> bytes:
+    """The synthetic clip, encoded once per session and uploaded from memory."""
+    path = tmp_path_factory.mktemp("clip") / "clip.avi"
+    _write_clip(path, _make_synthetic_frames())
+    return path.read_bytes()
+
+
+def _run_job(client, store, headers, clip_bytes: bytes, tracking: dict) -> dict:
+    request = {
+        "segment": {"start_ms": 0, "end_ms": 1500},
+        "calibration": CALIBRATION,
+        "tracking": tracking,
+    }
+    resp = client.post(
+        "/v1/jobs",
+        headers=headers,
+        files={"video_file": ("clip.avi", io.BytesIO(clip_bytes), "video/x-msvideo")},
+        data={"request_json": json.dumps(request)},
+    )
+    assert resp.status_code == 200, resp.text
+    job_id = resp.json()["job_id"]
+
+    assert store.wait(job_id, timeout=6.0), "job did not finish"
+    status = client.get(f"/v1/jobs/{job_id}", headers=headers).json()
+    assert status["status"] == "succeeded", status
+
+    resp = client.get(f"/v1/jobs/{job_id}/result", headers=headers)
+    assert resp.status_code == 200, resp.text
+    return resp.json()
+
+
+@pytest.mark.parametrize(
+    "detector",
+    [{}, {"detector": "combined"}],
+    ids=["auto", "combined"],
+)
+def test_create_job_and_fetch_result(client, job_store, fake_auth, clip_bytes, detector):
+    tracking = {"mode": "auto", "max_frames": 15, "sample_fps": 15, **detector}
+    payload = _run_job(client, job_store, fake_auth, clip_bytes, tracking)
+
+    result = payload["result"]
+    assert result["image_size"] == {"width": W, "height": H}
+    assert result["track"]["image_points"]
+    assert (job_store.data_dir / "jobs" / payload["job_id"] / "result.json").exists()
+
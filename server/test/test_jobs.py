@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import threading
+
+from app.jobs import JobStore
+from app.models import JobStatus
+
+
+def test_wait_returns_immediately_for_finished_job(tmp_path):
+    store = JobStore(data_dir=tmp_path)
+    job_id, paths = store.create_job()
+    store.write_status(paths, status=JobStatus.failed, progress=None, error=None)
+
+    assert store.wait(job_id, timeout=0)
+
+
+def test_wait_timeout_does_not_strand_other_waiters(tmp_path):
+    store = JobStore(data_dir=tmp_path)
+    job_id, paths = store.create_job()
+    results: dict[str, bool] = {}
+
+    def _wait(name: str, timeout: float) -> None:
+        results[name] = store.wait(job_id, timeout=timeout)
+
+    short = threading.Thread(target=_wait, args=("short", 0.05))
+    long = threading.Thread(target=_wait, args=("long", 5.0))
+    long.start()
+    short.start()
+    short.join()
+    store.write_status(paths, status=JobStatus.succeeded, progress=None, error=None)
+    long.join()
+
+    assert results == {"short": False, "long": True}